@@ -5,8 +5,11 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from django.urls import reverse
 from django.db.models import Count
+from django.db.models.functions import Now
+from django.core.cache import cache
 
-from .models import CustomUser, UserProfile
+from .models import CustomUser, UserProfile, make_code
+from .user_cache import invalidate_user_cache, invalidate_profile_cache
 
 
 class CustomUserCreationForm(UserCreationForm):
@@ -110,26 +113,78 @@ class CustomUserAdmin(BaseUserAdmin):
         return _('No avatar')
     display_avatar.short_description = _('Avatar Preview')
 
+    def _update_and_invalidate(self, queryset, **values):
+        # queryset.update() skips post_save, so clear what the signal handlers would have.
+        # Read the rows first: the changelist filters may no longer match them afterwards.
+        users = list(queryset.values_list('pk', 'email'))
+        updated = queryset.model.objects.filter(pk__in=[pk for pk, _email in users]).update(**values)
+        for pk, email in users:
+            invalidate_user_cache(email)
+            invalidate_profile_cache(pk)
+        return updated
+
     def mark_verified(self, request, queryset):
-        updated = queryset.update(is_verified=True, verification_code=None, verification_code_created=None)
+        updated = self._update_and_invalidate(
+            queryset, is_verified=True, verification_code=None, verification_code_created=None
+        )
         self.message_user(request, _(f"{updated} users marked as verified."))
     mark_verified.short_description = _("Mark selected users as verified")
 
     def mark_unverified(self, request, queryset):
-        updated = queryset.update(is_verified=False)
+        updated = self._update_and_invalidate(queryset, is_verified=False)
         self.message_user(request, _(f"{updated} users marked as unverified."))
     mark_unverified.short_description = _("Mark selected users as unverified")
 
     def reset_verification_code(self, request, queryset):
+        # Walk the selection in pk-ordered batches so memory stays flat however many users are selected
+        queryset = queryset.filter(is_verified=False).only('id', 'email').order_by('pk')
         count = 0
-        for user in queryset:
-            if not user.is_verified:
-                user.generate_verification_code()
-                count += 1
+        last_pk = 0
+        while True:
+            users = list(queryset.filter(pk__gt=last_pk)[:500])
+            if not users:
+                break
+            for user in users:
+                user.verification_code = make_code(6)
+                user.verification_code_created = Now()
+            CustomUser.objects.bulk_update(users, ['verification_code', 'verification_code_created'])
+
+            # bulk_update skips post_save, so drop the cached copies the signal would have cleared
+            for user in users:
+                invalidate_user_cache(user.email)
+            count += len(users)
+            last_pk = users[-1].pk
         self.message_user(request, _(f"Generated new verification codes for {count} users."))
     reset_verification_code.short_description = _("Reset verification codes for unverified users")
 
 
+class CountryFilter(admin.SimpleListFilter):
+    """
+    Country sidebar filter backed by a cached, bounded list of values
+    instead of a SELECT DISTINCT over every profile on each page load.
+    """
+    title = _('Country')
+    parameter_name = 'country'
+
+    def lookups(self, request, model_admin):
+        countries = cache.get_or_set(
+            'admin:profile_countries',
+            lambda: list(
+                UserProfile.objects.filter(country__gt='')
+                .order_by('country')
+                .values_list('country', flat=True)
+                .distinct()[:100]
+            ),
+            3600,
+        )
+        return [(country, country) for country in countries]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(country=self.value())
+        return queryset
+
+
 # Register UserProfile separately for direct access if needed
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
@@ -138,7 +193,9 @@ class UserProfileAdmin(admin.ModelAdmin):
     """
     list_display = ('user_email', 'company_name', 'city', 'country')
     search_fields = ('user__email', 'company_name', 'city', 'country')
-    list_filter = ('country', 'city')
+    # city is free text with unbounded distinct values; it stays reachable through search_fields
+    list_filter = (CountryFilter,)
+    list_select_related = ('user',)
     readonly_fields = ('user',)
 
     fieldsets = (
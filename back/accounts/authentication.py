@@ -0,0 +1,79 @@
+# accounts/authentication.py
+import copy
+import hashlib
+import threading
+import time
+from collections import namedtuple
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+CacheEntry = namedtuple('CacheEntry', ['user', 'token', 'expires_at'])
+
+TOKEN_CACHE_TTL = 5  # seconds
+TOKEN_CACHE_MAXSIZE = 10000
+
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
+
+def _cache_key(raw_token):
+    """Build the cache key for a raw bearer token"""
+    if isinstance(raw_token, str):
+        raw_token = raw_token.encode()
+    return hashlib.sha256(raw_token).digest()
+
+
+def clear_token_cache(user_id=None):
+    """
+    Drop cached tokens: those belonging to user_id (after a logout or
+    password change), or every entry when no user is given.
+    """
+    with _token_cache_lock:
+        if user_id is None:
+            _token_cache.clear()
+            return
+        for key in [key for key, entry in _token_cache.items() if entry.user.pk == user_id]:
+            del _token_cache[key]
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that remembers successfully validated tokens for a few
+    seconds, so repeated calls with the same bearer token skip signature
+    verification and the user lookup.
+
+    The cache keeps its own copy of the user and hands each request a fresh
+    copy, so per-request state memoized on request.user (e.g. computed
+    permissions) never leaks into later requests.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        key = _cache_key(raw_token)
+        now = time.time()
+
+        with _token_cache_lock:
+            entry = _token_cache.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    return copy.copy(entry.user), entry.token
+                del _token_cache[key]
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+
+        expires_at = min(now + TOKEN_CACHE_TTL, validated_token.get('exp', now))
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                _token_cache.pop(next(iter(_token_cache)))
+            _token_cache[key] = CacheEntry(copy.copy(user), validated_token, expires_at)
+
+        return user, validated_token
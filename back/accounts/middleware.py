@@ -47,12 +47,13 @@ class RequestLogMiddleware:
 
         request.req_start_time = time.monotonic()
 
-        if settings.DEBUG:
+        # Skip building the request details unless the records would be kept
+        if logger.isEnabledFor(logging.DEBUG):
             # Log request details
             method = request.method
             path = request.path_info
             ip = request.META.get('REMOTE_ADDR', '-')
-            logger.debug(f"REQUEST: {method} {path} from {ip}")
+            logger.debug("REQUEST: %s %s from %s", method, path, ip)
 
             # Log request body for non-GET methods
             if method not in ['GET', 'HEAD', 'OPTIONS'] and hasattr(request, 'body'):
@@ -62,11 +63,11 @@ class RequestLogMiddleware:
                         try:
                             body_data = json.loads(body)
                             masked_data = self._mask_sensitive_data(body_data)
-                            logger.debug(f"BODY: {json.dumps(masked_data)[:1000]}")
+                            logger.debug("BODY: %s", json.dumps(masked_data)[:1000])
                         except json.JSONDecodeError:
-                            logger.debug(f"BODY: {body[:500]} (Invalid JSON)")
+                            logger.debug("BODY: %s (Invalid JSON)", body[:500])
                 except Exception as e:
-                    logger.warning(f"Could not log request body: {e}")
+                    logger.warning("Could not log request body: %s", e)
 
     def _log_response(self, request, response):
         if self.is_excluded_path(request.path_info) or not hasattr(request, 'req_start_time'):
@@ -84,7 +85,7 @@ class RequestLogMiddleware:
         # Log slow requests
         slow_threshold = getattr(settings, 'SLOW_REQUEST_THRESHOLD_MS', 1000)
         if duration_ms > slow_threshold:
-            logger.warning(f"SLOW REQUEST: {request.method} {request.path_info} took {duration:.3f}s")
+            logger.warning("SLOW REQUEST: %s %s took %.3fs", request.method, request.path_info, duration)
 
         return response
 
@@ -120,7 +121,7 @@ class LoginTrackingMiddleware:
                 request.client_ip = self._get_client_ip(request)
                 request.user_agent = request.META.get('HTTP_USER_AGENT', 'Unknown')
             except Exception as e:
-                logger.error(f"Error setting login tracking attributes: {str(e)}")
+                logger.error("Error setting login tracking attributes: %s", e)
 
     async def __call__(self, request):
         self._process_request(request)
@@ -140,12 +141,12 @@ def track_successful_login(user, request):
         # For JWT-based security detection (extend as needed)
         is_new_device = True  # Placeholder for actual implementation
 
-        logger.info(f"Login: {user.email} from IP: {ip_address}, UA: '{user_agent[:50]}...'")
+        logger.info("Login: %s from IP: %s, UA: '%s...'", user.email, ip_address, user_agent[:50])
 
         # Add your security alerting logic here (e.g., new device detection)
         if is_new_device and hasattr(settings, 'LOGIN_SECURITY_ALERTS') and settings.LOGIN_SECURITY_ALERTS:
-            logger.warning(f"New device/location for {user.email} from {ip_address}")
+            logger.warning("New device/location for %s from %s", user.email, ip_address)
             # Implement your security alert mechanism here
 
     except Exception as e:
-        logger.error(f"Error tracking login: {str(e)}")
+        logger.error("Error tracking login: %s", e)
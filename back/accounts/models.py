@@ -5,7 +5,7 @@ from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.db import transaction
-import random
+import secrets
 import uuid
 from django.core.validators import RegexValidator, MinValueValidator
 
@@ -17,6 +17,10 @@ def user_avatar_path(instance, filename):
     user_uuid = instance.uuid if instance.uuid else 'temp'
     return f'users/{user_uuid}/avatars/{timestamp}_{filename}'
 
+def user_avatar_content_path(instance, digest, extension):
+    """ Content-addressed avatar path: MEDIA_ROOT/users/<user_uuid>/avatars/<digest><extension> """
+    return f'users/{instance.uuid}/avatars/{digest}{extension}'
+
 def user_document_path(instance, filename):
     """ For any other user-related documents """
     timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
@@ -24,6 +28,11 @@ def user_document_path(instance, filename):
     user_uuid = getattr(getattr(instance, 'user', instance), 'uuid', 'temp')
     return f'users/{user_uuid}/documents/{timestamp}_{filename}'
 
+# --- Code Generation ---
+def make_code(length=6):
+    """ Cryptographically random numeric code, zero-padded to length digits """
+    return f"{secrets.randbelow(10 ** length):0{length}d}"
+
 # --- Custom User Manager ---
 class CustomUserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -81,10 +90,15 @@ class CustomUser(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['-date_joined']),
+        ]
+
     def generate_verification_code(self, length=6):
         """Generate a random verification code"""
         if length < 4: length = 4
-        code = str(random.randint(10**(length-1), 10**length-1))
+        code = make_code(length)
         self.verification_code = code
         self.verification_code_created = timezone.now()
         self.is_verified = False
@@ -114,7 +128,7 @@ class CustomUser(AbstractUser):
     def generate_reset_code(self, length=6):
         """Generate password reset code"""
         if length < 4: length = 4
-        code = str(random.randint(10**(length-1), 10**length-1))
+        code = make_code(length)
         self.reset_code = code
         self.reset_code_created = timezone.now()
         self.save(update_fields=['reset_code', 'reset_code_created'])
@@ -4,6 +4,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.utils.translation import gettext_lazy as _
 from typing import Dict, Any, Optional
 from .models import UserProfile
+from base.models import RoleChoices
 from django.db import transaction
 import logging
 
@@ -48,7 +49,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     @transaction.atomic
     def create(self, validated_data):
         user = User.objects.create_user(**validated_data)
-        logger.info(f"User '{user.email}' created successfully")
+        logger.info("User '%s' created successfully", user.email)
         return user
 
 
@@ -106,7 +107,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             try:
                 return request.build_absolute_uri(obj.avatar.url)
             except Exception as e:
-                logger.warning(f"Could not build avatar URL: {e}")
+                logger.warning("Could not build avatar URL: %s", e)
         return None
 
     def to_representation(self, instance):
@@ -123,18 +124,41 @@ class UserProfileSerializer(serializers.ModelSerializer):
         decimal_fields = ['credit_limit', 'rating']
         date_fields = ['license_expiry']
 
+        # Only touch fields this serializer exposes (subclasses may narrow them)
         for field in text_fields:
-            rep[field] = getattr(profile, field, '') if profile else ''
+            if field in rep:
+                rep[field] = getattr(profile, field, '') if profile else ''
 
         for field in decimal_fields:
-            rep[field] = getattr(profile, field, None) if profile else (0.0 if field == 'credit_limit' else None)
+            if field in rep:
+                rep[field] = getattr(profile, field, None) if profile else (0.0 if field == 'credit_limit' else None)
 
         for field in date_fields:
-            rep[field] = getattr(profile, field, None) if profile else None
+            if field in rep:
+                rep[field] = getattr(profile, field, None) if profile else None
 
         return rep
 
 
+class PublicProfileSerializer(UserProfileSerializer):
+    """Profile fields that are safe to show to other users"""
+
+    class Meta(UserProfileSerializer.Meta):
+        fields = (
+            'id', 'uuid',
+            'first_name', 'last_name',
+            'avatar_url',
+            'is_active', 'is_staff', 'date_joined',
+            # Profile fields
+            'bio', 'company_name',
+            'city', 'state', 'postal_code', 'country',
+            'license_number', 'license_expiry',
+            'preferred_locations', 'property_preferences',
+            'rating',
+        )
+        read_only_fields = fields
+
+
 class UserProfileUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating User and associated UserProfile fields"""
     # User fields (updatable)
@@ -228,7 +252,7 @@ class UserBriefSerializer(serializers.ModelSerializer):
                 role_code = obj.primary_role or ''
                 return {
                     'code': role_code,
-                    'name': dict(RoleChoices.CHOICES).get(role_code, '')
+                    'name': RoleChoices.LABELS.get(role_code, '')
                 }
 
             # If not, try to get a role from related data
@@ -250,7 +274,7 @@ class UserBriefSerializer(serializers.ModelSerializer):
             # Log the error and return empty values
             import logging
             logger = logging.getLogger(__name__)
-            logger.error(f"Error getting primary role: {str(e)}")
+            logger.error("Error getting primary role: %s", e)
             return {
                 'code': '',
                 'name': ''
@@ -0,0 +1,53 @@
+"""Background tasks for account emails, token blacklisting and file cleanup."""
+from smtplib import SMTPException
+import logging
+
+from celery import shared_task
+from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.db import DatabaseError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .utils import send_verification_email, send_password_reset_email
+
+logger = logging.getLogger(__name__)
+
+
+# These are routed to the 'mail' queue by CELERY_TASK_ROUTES in settings.
+# The views rate-limit before queueing, so the senders skip their own per-address
+# budget here; otherwise each SMTP retry would spend an attempt and the mail be dropped.
+@shared_task(rate_limit='12/s', autoretry_for=(SMTPException,), retry_backoff=True, max_retries=5)
+def send_verification_email_task(email, verification_code, context=None):
+    """Send the account verification email outside the request cycle."""
+    send_verification_email(email, verification_code, context, check_limits=False)
+    logger.info("Verification email sent to %s", email)
+
+
+@shared_task(autoretry_for=(SMTPException,), retry_backoff=True, max_retries=5)
+def send_password_reset_email_task(email, reset_code, context=None):
+    """Send the password reset email outside the request cycle."""
+    send_password_reset_email(email, reset_code, context, check_limits=False)
+    logger.info("Password reset email sent to %s", email)
+
+
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3)
+def delete_storage_file_task(name):
+    """Delete a replaced file (e.g. an old avatar) from default storage."""
+    # Avatars are named after their content, so re-uploading the old image before this
+    # task runs points the user back at the same file; leave it in place
+    if get_user_model().objects.filter(avatar=name).exists():
+        logger.info("Kept stored file %s, still referenced", name)
+        return
+    default_storage.delete(name)
+    logger.info("Deleted stored file %s", name)
+
+
+@shared_task(autoretry_for=(DatabaseError,), retry_backoff=True, max_retries=3)
+def blacklist_refresh_token_task(refresh_token):
+    """Write the blacklist row for a refresh token revoked at logout."""
+    try:
+        RefreshToken(refresh_token).blacklist()
+    except TokenError as e:
+        # Already blacklisted or expired; nothing left to revoke
+        logger.info("Skipped blacklisting refresh token: %s", e)
@@ -0,0 +1,359 @@
+import io
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from PIL import Image
+
+from accounts.tasks import send_verification_email_task
+from accounts.authentication import CachedJWTAuthentication, clear_token_cache
+from accounts.user_cache import get_user_by_email, get_serialized_profile
+from accounts.serializers import PublicProfileSerializer
+from accounts.utils import rate_limit, detect_image_type, create_response
+
+User = get_user_model()
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+}
+
+
+# -------------------------------------------------------------------------
+# Authentication Tests
+# -------------------------------------------------------------------------
+
+
+class CachedJWTAuthenticationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='auth@test.com', password='password',
+            first_name='Auth', last_name='User'
+        )
+
+    def setUp(self):
+        clear_token_cache()
+        self.factory = APIRequestFactory()
+        self.token = str(AccessToken.for_user(self.user))
+
+    def _request(self):
+        return self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+    def test_repeat_token_skips_validation(self):
+        auth = CachedJWTAuthentication()
+        user, _ = auth.authenticate(self._request())
+        self.assertEqual(user, self.user)
+
+        with mock.patch.object(CachedJWTAuthentication, 'get_validated_token') as validate:
+            user, _ = auth.authenticate(self._request())
+            validate.assert_not_called()
+        self.assertEqual(user, self.user)
+
+    def test_cached_hits_get_their_own_user_instance(self):
+        auth = CachedJWTAuthentication()
+        first, _ = auth.authenticate(self._request())
+        first._base_permissions_cache = {'leaked'}
+
+        second, _ = auth.authenticate(self._request())
+        self.assertIsNot(second, first)
+        self.assertFalse(hasattr(second, '_base_permissions_cache'))
+
+    def test_clearing_a_user_forces_revalidation(self):
+        auth = CachedJWTAuthentication()
+        auth.authenticate(self._request())
+        clear_token_cache(self.user.pk)
+
+        with mock.patch.object(
+            CachedJWTAuthentication, 'get_validated_token', wraps=auth.get_validated_token
+        ) as validate:
+            auth.authenticate(self._request())
+            validate.assert_called_once()
+
+    def test_password_reset_forces_revalidation(self):
+        auth = CachedJWTAuthentication()
+        auth.authenticate(self._request())
+        User.objects.filter(pk=self.user.pk).update(reset_code='123456', reset_code_created=timezone.now())
+
+        response = APIClient().post('/api/accounts/password/reset/confirm/', {
+            'email': self.user.email, 'reset_code': '123456',
+            'new_password': 'N3w-password!', 'confirm_password': 'N3w-password!'
+        })
+        self.assertEqual(response.status_code, 200)
+
+        with mock.patch.object(
+            CachedJWTAuthentication, 'get_validated_token', wraps=auth.get_validated_token
+        ) as validate:
+            auth.authenticate(self._request())
+            validate.assert_called_once()
+
+    def test_missing_header_is_anonymous(self):
+        auth = CachedJWTAuthentication()
+        self.assertIsNone(auth.authenticate(self.factory.get('/')))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class UserCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='cache@test.com', password='password',
+            first_name='Cache', last_name='User'
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_repeat_lookup_hits_cache(self):
+        get_user_by_email('cache@test.com')
+        with self.assertNumQueries(0):
+            user = get_user_by_email('cache@test.com')
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_save_invalidates_entry(self):
+        get_user_by_email('cache@test.com')
+        self.user.first_name = 'Changed'
+        self.user.save()
+        self.assertEqual(get_user_by_email('cache@test.com').first_name, 'Changed')
+
+    def test_cached_entry_does_not_match_other_case(self):
+        get_user_by_email('cache@test.com')
+        with self.assertRaises(User.DoesNotExist):
+            get_user_by_email('Cache@test.com')
+
+    def test_case_variant_accounts_get_their_own_rows(self):
+        other = User.objects.create_user(
+            email='Cache@test.com', password='password',
+            first_name='Other', last_name='User'
+        )
+        self.assertEqual(get_user_by_email('cache@test.com').pk, self.user.pk)
+        self.assertEqual(get_user_by_email('Cache@test.com').pk, other.pk)
+
+    def test_lookup_and_profile_use_one_query(self):
+        with self.assertNumQueries(1):
+            get_serialized_profile(get_user_by_email('cache@test.com'))
+
+    def test_profile_save_invalidates_serialized_profile(self):
+        self.assertEqual(get_serialized_profile(self.user)['bio'], '')
+        profile = self.user.profile
+        profile.bio = 'Updated'
+        profile.save()
+        self.assertEqual(get_serialized_profile(self.user)['bio'], 'Updated')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RateLimitTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_blocks_after_limit(self):
+        self.assertTrue(rate_limit('login:a@test.com', 2, 60))
+        self.assertTrue(rate_limit('login:a@test.com', 2, 60))
+        self.assertFalse(rate_limit('login:a@test.com', 2, 60))
+
+    def test_keys_are_independent(self):
+        self.assertTrue(rate_limit('login:a@test.com', 1, 60))
+        self.assertTrue(rate_limit('login:b@test.com', 1, 60))
+
+
+class CreateResponseTest(TestCase):
+
+    def test_error_body_matches_rendered_response(self):
+        response = create_response(error="Invalid credentials", error_code="invalid_credentials", status_code=401)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            response.content,
+            b'{"status":"error","error":{"message":"Invalid credentials","code":"invalid_credentials"}}'
+        )
+
+    def test_error_with_data_is_not_precomputed(self):
+        response = create_response(error="Invalid", data={'field': 'x'}, status_code=400)
+        self.assertEqual(response.data['data'], {'field': 'x'})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, DEBUG=False)
+class EmailTaskTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_retries_do_not_spend_the_per_address_budget(self):
+        # The sender allows three verification emails per address; task retries must not count
+        for _ in range(4):
+            send_verification_email_task('retry@test.com', '123456')
+        self.assertEqual(len(mail.outbox), 4)
+
+
+class DetectImageTypeTest(TestCase):
+
+    def test_recognizes_png_signature(self):
+        upload = io.BytesIO(b'\x89PNG\r\n\x1a\n' + b'\x00' * 16)
+        self.assertEqual(detect_image_type(upload), 'image/png')
+        self.assertEqual(upload.tell(), 0)
+
+    def test_rejects_spoofed_content(self):
+        self.assertIsNone(detect_image_type(io.BytesIO(b'<svg onload="alert(1)">')))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CustomUserAdminTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(
+            email='admin@test.com', password='password',
+            first_name='Admin', last_name='User'
+        )
+        self.user = User.objects.create_user(
+            email='pending@test.com', password='password',
+            first_name='Pending', last_name='User'
+        )
+        self.client.force_login(self.admin)
+
+    def test_mark_verified_clears_cached_user_and_profile(self):
+        self.assertFalse(get_user_by_email('pending@test.com').is_verified)
+        self.assertFalse(get_serialized_profile(self.user)['is_verified'])
+
+        self.client.post('/admin/accounts/customuser/?is_verified__exact=0', {
+            'action': 'mark_verified', '_selected_action': [self.user.pk],
+        })
+
+        user = get_user_by_email('pending@test.com')
+        self.assertTrue(user.is_verified)
+        self.assertTrue(get_serialized_profile(user)['is_verified'])
+
+
+# -------------------------------------------------------------------------
+# Serializer Tests
+# -------------------------------------------------------------------------
+
+
+class PublicProfileSerializerTest(TestCase):
+
+    def test_sensitive_fields_are_not_exposed(self):
+        user = User.objects.create_user(
+            email='public@test.com', password='password',
+            first_name='Public', last_name='User'
+        )
+        data = PublicProfileSerializer(user).data
+        self.assertEqual(data['first_name'], 'Public')
+        for field in ['email', 'phone_number', 'tax_id', 'address', 'credit_limit']:
+            self.assertNotIn(field, data)
+
+
+# -------------------------------------------------------------------------
+# View Tests
+# -------------------------------------------------------------------------
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class LogoutViewTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='logout@test.com', password='password',
+            first_name='Logout', last_name='User'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_logged_out_refresh_token_cannot_be_used(self):
+        refresh = str(RefreshToken.for_user(self.user))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/accounts/logout/', {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post('/api/accounts/token/refresh/', {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+
+class UserProfileViewTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='profile@test.com', password='password',
+            first_name='Profile', last_name='User'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_profile_renders_as_json(self):
+        response = self.client.get('/api/accounts/profile/')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['data']['user']['email'], 'profile@test.com')
+
+    def test_unchanged_profile_returns_not_modified(self):
+        response = self.client.get('/api/accounts/profile/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Authorization', response['Vary'])
+
+        response = self.client.get('/api/accounts/profile/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class UpdateAvatarViewTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='avatar@test.com', password='password',
+            first_name='Avatar', last_name='User'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _upload(self):
+        buffer = io.BytesIO()
+        Image.new('RGB', (4, 4), 'red').save(buffer, format='PNG')
+        avatar = SimpleUploadedFile('me.png', buffer.getvalue(), content_type='image/png')
+        return self.client.post('/api/accounts/profile/avatar/', {'avatar': avatar}, format='multipart')
+
+    def test_reuploading_same_image_skips_write(self):
+        self.assertEqual(self._upload().status_code, 200)
+        self.user.refresh_from_db()
+        first_name = self.user.avatar.name
+        self.assertTrue(first_name.endswith('.png'))
+
+        with mock.patch('django.core.files.storage.FileSystemStorage.save') as save:
+            self.assertEqual(self._upload().status_code, 200)
+            save.assert_not_called()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.avatar.name, first_name)
+
+    def test_reupload_before_cleanup_keeps_file(self):
+        def upload(color):
+            buffer = io.BytesIO()
+            Image.new('RGB', (4, 4), color).save(buffer, format='PNG')
+            avatar = SimpleUploadedFile('me.png', buffer.getvalue(), content_type='image/png')
+            return self.client.post('/api/accounts/profile/avatar/', {'avatar': avatar}, format='multipart')
+
+        upload('red')
+        self.user.refresh_from_db()
+        red = self.user.avatar.name
+
+        # Hold the cleanup of the red avatar until after it has been uploaded again
+        with self.captureOnCommitCallbacks() as callbacks:
+            upload('blue')
+        upload('red')
+        for callback in callbacks:
+            callback()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.avatar.name, red)
+        self.assertTrue(self.user.avatar.storage.exists(red))
+
+    def test_rejects_non_image(self):
+        avatar = SimpleUploadedFile('me.png', b'not an image', content_type='image/png')
+        response = self.client.post('/api/accounts/profile/avatar/', {'avatar': avatar}, format='multipart')
+        self.assertEqual(response.status_code, 400)
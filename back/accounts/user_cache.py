@@ -0,0 +1,110 @@
+"""Short-lived caches for user lookups and serialized profiles on the auth endpoints."""
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import UserProfile
+
+User = get_user_model()
+
+USER_CACHE_TIMEOUT = 30  # seconds
+PROFILE_CACHE_TIMEOUT = 300  # seconds
+
+# Columns needed by the code/password flows that never serialize the profile
+AUTH_FIELDS = (
+    'id', 'uuid', 'email', 'password', 'is_active', 'is_verified',
+    'first_name', 'last_name', 'verification_code', 'verification_code_created',
+    'reset_code', 'reset_code_created',
+)
+
+
+def user_cache_key(email: str, auth_only: bool = False) -> str:
+    """
+    Return the cache key for a user's email address.
+
+    The key uses the exact email because the lookup and the unique
+    constraint are both case-sensitive; folding case here would let
+    differently-cased addresses share (or miss) an entry.
+    """
+    key = f"user:email:{email}"
+    return f"{key}:auth" if auth_only else key
+
+
+def get_user_by_email(email: str, auth_only: bool = False):
+    """
+    Fetch a user by email, serving repeat lookups from the cache.
+
+    Args:
+        email: The user's email address.
+        auth_only: Load only AUTH_FIELDS. Use this when the caller does not
+            serialize the profile, otherwise deferred columns cost extra queries.
+
+    Raises:
+        User.DoesNotExist: If no user has this email.
+    """
+    key = user_cache_key(email, auth_only)
+    user = cache.get(key)
+    if user is None:
+        # The full variant feeds profile serialization, so join the profile in the same SELECT
+        queryset = User.objects.only(*AUTH_FIELDS) if auth_only else User.objects.select_related('profile')
+        user = queryset.get(email=email)
+        cache.set(key, user, USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_user_cache(email: str) -> None:
+    """Drop the cached entries for an email address."""
+    if email:
+        cache.delete_many([user_cache_key(email), user_cache_key(email, auth_only=True)])
+
+
+def _profile_version_key(user_pk) -> str:
+    return f"profile:version:{user_pk}"
+
+
+def _profile_version(user_pk) -> str:
+    """Return the current cache version for a user's serialized profile."""
+    key = _profile_version_key(user_pk)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(key, version, PROFILE_CACHE_TIMEOUT)
+    return version
+
+
+def get_serialized_profile(user, request=None) -> dict:
+    """
+    Return UserProfileSerializer output for a user, cached per profile version.
+
+    The request origin is part of the key because avatar_url is absolute.
+    """
+    from .serializers import UserProfileSerializer
+
+    origin = request.build_absolute_uri('/') if request else ''
+    key = f"profile:v1:{user.pk}:{_profile_version(user.pk)}:{origin}"
+    data = cache.get(key)
+    if data is None:
+        data = dict(UserProfileSerializer(user, context={'request': request}).data)
+        cache.set(key, data, PROFILE_CACHE_TIMEOUT)
+    return data
+
+
+def invalidate_profile_cache(user_pk) -> None:
+    """Move a user's serialized profile to a fresh cache version."""
+    cache.delete(_profile_version_key(user_pk))
+
+
+@receiver([post_save, post_delete], sender=User)
+def _invalidate_on_change(sender, instance, **kwargs):
+    invalidate_user_cache(instance.email)
+    invalidate_profile_cache(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def _invalidate_on_profile_change(sender, instance, **kwargs):
+    # Cached users carry their profile, so drop them along with the serialized copy
+    invalidate_user_cache(instance.user.email)
+    invalidate_profile_cache(instance.user_id)
@@ -4,8 +4,11 @@ from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.core.cache import cache
+from django.http import HttpResponse
 from typing import Dict, Any, Optional, Union
+from functools import lru_cache
 import logging
+import orjson
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.response import Response
@@ -34,14 +37,62 @@ class EmailRateLimitExceeded(Exception):
         super().__init__(message)
 
 
+# Leading bytes of the image formats accepted for avatars
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+# File extension stored for each accepted avatar type
+IMAGE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+}
+
+
+def detect_image_type(file_obj) -> Optional[str]:
+    """Return the MIME type implied by a file's magic bytes, or None if unrecognized."""
+    head = file_obj.read(16)
+    file_obj.seek(0)
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return mime_type
+    return None
+
+
+@lru_cache(maxsize=256)
+def _error_body(error: str, error_code: Optional[str]) -> bytes:
+    """Render the JSON body of an error-only response once per message/code pair."""
+    response_error = {"message": error}
+    if error_code:
+        response_error["code"] = error_code
+    return orjson.dumps({"status": "error", "error": response_error})
+
+
 def create_response(
     data: Optional[Dict[str, Any]] = None,
     message: Optional[str] = None,
     error: Optional[str] = None,
     error_code: Optional[str] = None,
     status_code: int = status.HTTP_200_OK
-) -> Response:
-    """Create standardized API response."""
+) -> HttpResponse:
+    """Create standardized API response.
+
+    Error-only responses are returned as a plain HttpResponse with a
+    pre-rendered JSON body and skip DRF rendering; everything else is a
+    DRF Response.
+    """
+    if data is None and message is None and isinstance(error, str):
+        # Plain error responses are static; reuse their pre-rendered body
+        return HttpResponse(
+            _error_body(error, error_code),
+            status=status_code,
+            content_type='application/json'
+        )
+
     response_data = {"status": "error" if error else "success"}
 
     if data is not None:
@@ -59,7 +110,7 @@ def create_response(
 def check_rate_limit(identifier: str, action_type: str) -> None:
     """Check if action exceeds rate limit."""
     if not identifier:
-        logger.warning(f"Empty identifier for rate limit check: {action_type}")
+        logger.warning("Empty identifier for rate limit check: %s", action_type)
         return
 
     # Get limits for action type
@@ -75,13 +126,35 @@ def check_rate_limit(identifier: str, action_type: str) -> None:
     if attempts >= max_attempts:
         # Fixed for Django 4.1.5's LocMemCache that doesn't have ttl method
         wait_minutes = lockout_time // 60
-        logger.warning(f"Rate limit exceeded: {action_type} by {identifier}. Attempts: {attempts}/{max_attempts}")
+        logger.warning("Rate limit exceeded: %s by %s. Attempts: %s/%s", action_type, identifier, attempts, max_attempts)
         raise EmailRateLimitExceeded(wait_minutes=wait_minutes)
 
     # Increment attempts
     cache.set(cache_key, attempts + 1, timeout=lockout_time)
 
 
+def rate_limit(key: str, limit: int, window: int) -> bool:
+    """
+    Count one hit against a fixed-window limit.
+
+    Returns True while the number of hits within ``window`` seconds is at most ``limit``.
+    """
+    cache_key = f"rate_limit:{key.lower()}"
+    cache.add(cache_key, 0, timeout=window)
+    try:
+        count = cache.incr(cache_key)
+    except ValueError:
+        # Key expired between add() and incr()
+        cache.set(cache_key, 1, timeout=window)
+        count = 1
+    return count <= limit
+
+
+def is_rate_limited(key: str, limit: int) -> bool:
+    """Return True if ``key`` has already used up ``limit`` hits, without counting a new one."""
+    return cache.get(f"rate_limit:{key.lower()}", 0) >= limit
+
+
 def send_email(
     to_email: str,
     subject: str,
@@ -95,7 +168,7 @@ def send_email(
     Send an email using Django templates with rate limiting.
     """
     if not to_email:
-        logger.error(f"Attempted to send email with empty recipient: {subject}")
+        logger.error("Attempted to send email with empty recipient: %s", subject)
         return False
 
     # Rate limiting
@@ -103,7 +176,7 @@ def send_email(
         try:
             check_rate_limit(to_email, action_type)
         except EmailRateLimitExceeded as e:
-            logger.warning(f"Rate limit hit: {action_type} to {to_email}")
+            logger.warning("Rate limit hit: %s to %s", action_type, to_email)
             raise e
 
     # Add common context data
@@ -126,7 +199,7 @@ def send_email(
         try:
             html_message = render_to_string(html_template, context)
         except TemplateSyntaxError as e:
-            logger.error(f"Template syntax error in {html_template}: {str(e)}")
+            logger.error("Template syntax error in %s: %s", html_template, e)
             if not fail_silently:
                 raise
             return False
@@ -140,12 +213,12 @@ def send_email(
 
         # Debug mode console output
         if settings.DEBUG and 'console' in getattr(settings, 'EMAIL_BACKEND', ''):
-            logger.info(f"\n{'='*40}\nEMAIL TO: {to_email}\nSUBJECT: {full_subject}\nTEMPLATE: {template_name}\n{'='*40}")
+            logger.info("\n%s\nEMAIL TO: %s\nSUBJECT: %s\nTEMPLATE: %s\n%s", '='*40, to_email, full_subject, template_name, '='*40)
             # Log verification/reset codes only in debug
             if settings.DEBUG and action_type in ['verification', 'reset']:
                 code = context.get('verification_code') or context.get('reset_code')
                 if code:
-                    logger.info(f"DEBUG - {action_type.upper()} CODE: {code}")
+                    logger.info("DEBUG - %s CODE: %s", action_type.upper(), code)
             return True
 
         # Send actual email
@@ -157,18 +230,19 @@ def send_email(
             recipient_list=[to_email],
             fail_silently=fail_silently
         )
-        logger.info(f"Email sent: {subject} to {to_email}")
+        logger.info("Email sent: %s to %s", subject, to_email)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to send {action_type} email to {to_email}: {str(e)}", exc_info=True)
+        logger.error("Failed to send %s email to %s: %s", action_type, to_email, e, exc_info=True)
         if not fail_silently:
             raise
         return False
 
 # Specific email functions with preset templates and contexts
-def send_verification_email(email: str, verification_code: str, context: Optional[Dict[str, Any]] = None) -> None:
-    """Send verification code email."""
+def send_verification_email(email: str, verification_code: str, context: Optional[Dict[str, Any]] = None,
+                            check_limits: bool = True) -> None:
+    """Send verification code email. Pass check_limits=False when the caller already rate-limits."""
     ctx = context or {}
     ctx['verification_code'] = verification_code
     ctx['expiry_hours'] = RATE_LIMITS['verification']['lockout_seconds'] // 3600
@@ -178,7 +252,7 @@ def send_verification_email(email: str, verification_code: str, context: Optiona
         ctx['verification_url'] = f"{settings.FRONTEND_URL.rstrip('/')}{verify_path}/{verification_code}"
 
     # Skip rate limiting in development
-    check_limits = not settings.DEBUG
+    check_limits = check_limits and not settings.DEBUG
 
     send_email(
         to_email=email,
@@ -190,8 +264,9 @@ def send_verification_email(email: str, verification_code: str, context: Optiona
     )
 
 
-def send_password_reset_email(email: str, reset_code: str, context: Optional[Dict[str, Any]] = None) -> None:
-    """Send password reset code email."""
+def send_password_reset_email(email: str, reset_code: str, context: Optional[Dict[str, Any]] = None,
+                              check_limits: bool = True) -> None:
+    """Send password reset code email. Pass check_limits=False when the caller already rate-limits."""
     ctx = context or {}
     ctx['reset_code'] = reset_code
     ctx['expiry_hours'] = RATE_LIMITS['reset']['lockout_seconds'] // 3600
@@ -205,7 +280,8 @@ def send_password_reset_email(email: str, reset_code: str, context: Optional[Dic
         subject="Reset Your Password",
         template_name='password_reset',
         context=ctx,
-        action_type='reset'
+        action_type='reset',
+        check_limits=check_limits
     )
 
 
@@ -230,7 +306,10 @@ def send_login_alert_email(email: str, ip_address: Optional[str] = None, locatio
 
 # Simple debug request decorator
 def debug_request(view_func):
-    """Log request details in debug mode."""
+    """Log request details in debug mode; outside DEBUG the view is returned unwrapped."""
+    if not settings.DEBUG:
+        return view_func
+
     from functools import wraps
     import json
 
@@ -238,10 +317,10 @@ def debug_request(view_func):
     def wrapper(request, *args, **kwargs):
         response = view_func(request, *args, **kwargs)
 
-        if settings.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             try:
                 # Basic request info
-                logger.debug(f"DEBUG: {request.method} {request.path}")
+                logger.debug("DEBUG: %s %s", request.method, request.path)
 
                 # Request body for non-GET requests
                 if request.method not in ['GET', 'HEAD'] and hasattr(request, 'body') and request.body:
@@ -254,7 +333,7 @@ def debug_request(view_func):
                                 for k in body:
                                     if any(s in k.lower() for s in ['password', 'token', 'key', 'secret']):
                                         body[k] = '[REDACTED]'
-                            logger.debug(f"BODY: {json.dumps(body)[:500]}")
+                            logger.debug("BODY: %s", json.dumps(body)[:500])
                         except:
                             pass
             except:
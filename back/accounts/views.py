@@ -1,9 +1,19 @@
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models.functions import Now
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from datetime import timedelta
+import hashlib
 import logging
+import time
+
+from PIL import Image
 
 from rest_framework import status
 from rest_framework.views import APIView
@@ -13,26 +23,40 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from django.template.exceptions import TemplateSyntaxError
 
-from .models import UserProfile
+from .models import UserProfile, user_avatar_content_path
 from .serializers import (
     UserRegistrationSerializer,
-    UserProfileSerializer,
     UserProfileUpdateSerializer,
+    PublicProfileSerializer,
 )
 from .utils import (
-    send_verification_email,
-    send_password_reset_email,
-    EmailRateLimitExceeded,
     create_response,
-    debug_request
+    debug_request,
+    rate_limit,
+    is_rate_limited,
+    detect_image_type,
+    IMAGE_EXTENSIONS
 )
 from .middleware import track_successful_login
 from .permissions import IsOwnerOrAdmin, IsAdminUser
+from .authentication import CachedJWTAuthentication, clear_token_cache
+from .user_cache import get_user_by_email, get_serialized_profile
+from .tasks import (
+    send_verification_email_task,
+    send_password_reset_email_task,
+    delete_storage_file_task,
+    blacklist_refresh_token_task,
+)
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
+def logged_out_token_key(jti):
+    """Cache key marking a refresh token as logged out before it is blacklisted"""
+    return f"token:logged_out:{jti}"
+
+
 def get_tokens_for_user(user):
     """Generate JWT tokens for user"""
     refresh = RefreshToken.for_user(user)
@@ -49,6 +73,14 @@ class RegisterView(APIView):
     @transaction.atomic
     def post(self, request):
         """Register a new user"""
+        ip = request.META.get('REMOTE_ADDR', '')
+        if not rate_limit(f"register:ip:{ip}", 5, 3600):
+            return create_response(
+                error="Too many registration attempts. Please try again later.",
+                error_code="rate_limit",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
         try:
             serializer = UserRegistrationSerializer(data=request.data)
             if not serializer.is_valid():
@@ -61,27 +93,16 @@ class RegisterView(APIView):
             user = serializer.save()
             verification_code = user.generate_verification_code()
 
-            try:
-                context = {
-                    'user_name': f"{user.first_name} {user.last_name}",
-                    'verification_code': verification_code,
-                    'expiry_hours': 24
-                }
-                send_verification_email(user.email, verification_code, context)
-                logger.info(f"Verification email sent to {user.email}")
-            except EmailRateLimitExceeded as e:
-                return create_response(
-                    error=str(e),
-                    error_code="rate_limit_exceeded",
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS
-                )
-            except Exception as email_error:
-                logger.error(f"Failed to send verification email: {email_error}", exc_info=True)
-                return create_response(
-                    message="Registration successful but failed to send verification email. Please use resend option.",
-                    data={"email": user.email},
-                    status_code=status.HTTP_201_CREATED
-                )
+            context = {
+                'user_name': f"{user.first_name} {user.last_name}",
+                'verification_code': verification_code,
+                'expiry_hours': 24
+            }
+            # Queue the email once the user row is committed
+            transaction.on_commit(
+                lambda: send_verification_email_task.delay(user.email, verification_code, context),
+                robust=True
+            )
 
             return create_response(
                 message="Registration successful. Please check your email for verification.",
@@ -90,7 +111,7 @@ class RegisterView(APIView):
             )
 
         except Exception as e:
-            logger.error(f"Registration failed: {str(e)}", exc_info=True)
+            logger.error("Registration failed: %s", e, exc_info=True)
             return create_response(
                 error="Registration failed. Please try again later.",
                 error_code="registration_failed",
@@ -114,8 +135,15 @@ class VerifyEmailView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
+        if not rate_limit(f"verify:{email}", 10, 600):
+            return create_response(
+                error="Too many verification attempts. Please try again later.",
+                error_code="rate_limit",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
         try:
-            user = User.objects.get(email=email)
+            user = get_user_by_email(email)
 
             if user.is_verified:
                 tokens = get_tokens_for_user(user)
@@ -123,19 +151,23 @@ class VerifyEmailView(APIView):
                     message="Email already verified",
                     data={
                         'tokens': tokens,
-                        'user': UserProfileSerializer(user, context={'request': request}).data
+                        'user': get_serialized_profile(user, request)
                     }
                 )
 
-            if user.verify_account(verification_code):
-                tokens = get_tokens_for_user(user)
-                logger.info(f"Email verification successful for user {user.id}")
+            # Verification update and outstanding-token insert commit together
+            with transaction.atomic():
+                verified = user.verify_account(verification_code)
+                tokens = get_tokens_for_user(user) if verified else None
+
+            if verified:
+                logger.info("Email verification successful for user %s", user.id)
 
                 return create_response(
                     message="Email verified successfully",
                     data={
                         'tokens': tokens,
-                        'user': UserProfileSerializer(user, context={'request': request}).data
+                        'user': get_serialized_profile(user, request)
                     }
                 )
             else:
@@ -152,7 +184,7 @@ class VerifyEmailView(APIView):
                 status_code=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Verification error: {str(e)}", exc_info=True)
+            logger.error("Verification error: %s", e, exc_info=True)
             return create_response(
                 error="An unexpected error occurred",
                 error_code="server_error",
@@ -162,6 +194,7 @@ class VerifyEmailView(APIView):
 
 class LoginView(APIView):
     permission_classes = [AllowAny]
+    throttle_scope = 'login'
 
     @debug_request
     def post(self, request):
@@ -176,9 +209,24 @@ class LoginView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
+        if not rate_limit(f"login:{email}", 10, 60):
+            return create_response(
+                error="Too many login attempts. Please try again later.",
+                error_code="rate_limit",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        # Refuse before hashing once an email has too many recent failures
+        if is_rate_limited(f"login:fail:{email}", 10):
+            return create_response(
+                error="Too many failed login attempts. Please try again later.",
+                error_code="rate_limit",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
         try:
             try:
-                user = User.objects.get(email=email)
+                user = get_user_by_email(email)
             except User.DoesNotExist:
                 return create_response(
                     error="Invalid credentials",
@@ -187,6 +235,7 @@ class LoginView(APIView):
                 )
 
             if not user.check_password(password):
+                rate_limit(f"login:fail:{email}", 10, 300)
                 return create_response(
                     error="Invalid credentials",
                     error_code="invalid_credentials",
@@ -210,19 +259,24 @@ class LoginView(APIView):
             # Track successful login
             track_successful_login(user, request)
 
-            # Generate JWT tokens
-            tokens = get_tokens_for_user(user)
+            # Outstanding-token insert and last_login update commit together
+            with transaction.atomic():
+                # Generate JWT tokens
+                tokens = get_tokens_for_user(user)
+
+                # Single-column UPDATE; skips save() signals so the cached user and profile stay warm
+                User.objects.filter(pk=user.pk).update(last_login=Now())
 
-            logger.info(f"Successful login for user: {email}")
+            logger.info("Successful login for user: %s", email)
             return create_response(
                 data={
                     'tokens': tokens,
-                    'user': UserProfileSerializer(user, context={'request': request}).data
+                    'user': get_serialized_profile(user, request)
                 }
             )
 
         except Exception as e:
-            logger.error(f"Login failed: {str(e)}", exc_info=True)
+            logger.error("Login failed: %s", e, exc_info=True)
             return create_response(
                 error="Login failed. Please try again.",
                 error_code="login_failed",
@@ -245,9 +299,19 @@ class LogoutView(APIView):
                 )
 
             token = RefreshToken(refresh_token)
-            token.blacklist()
 
-            logger.info(f"User {request.user.email} logged out successfully")
+            # Mark the token as logged out right away; the blacklist row is written in the background
+            remaining = int(token['exp'] - time.time())
+            if remaining > 0:
+                cache.set(logged_out_token_key(token['jti']), True, timeout=remaining)
+            transaction.on_commit(
+                lambda: blacklist_refresh_token_task.delay(refresh_token),
+                robust=True
+            )
+
+            clear_token_cache(request.user.pk)
+
+            logger.info("User %s logged out successfully", request.user.email)
             return create_response(message="Logged out successfully")
         except TokenError:
             return create_response(
@@ -256,7 +320,7 @@ class LogoutView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Logout failed: {str(e)}", exc_info=True)
+            logger.error("Logout failed: %s", e, exc_info=True)
             return create_response(
                 error="Logout failed",
                 error_code="logout_failed",
@@ -279,6 +343,9 @@ class TokenRefreshView(APIView):
                 )
 
             refresh = RefreshToken(refresh_token)
+            if cache.get(logged_out_token_key(refresh['jti'])):
+                raise TokenError("Token is blacklisted")
+
             return create_response(
                 data={
                     'access': str(refresh.access_token)
@@ -291,7 +358,7 @@ class TokenRefreshView(APIView):
                 status_code=status.HTTP_401_UNAUTHORIZED
             )
         except Exception as e:
-            logger.error(f"Token refresh failed: {str(e)}", exc_info=True)
+            logger.error("Token refresh failed: %s", e, exc_info=True)
             return create_response(
                 error="An error occurred during token refresh",
                 error_code="token_refresh_error",
@@ -300,6 +367,7 @@ class TokenRefreshView(APIView):
 
 
 class VerifyTokenView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -321,7 +389,7 @@ class VerifyTokenView(APIView):
 
             return create_response(data={"valid": True, "user": user_data})
         except Exception as e:
-            logger.error(f"Token verification error: {str(e)}", exc_info=True)
+            logger.error("Token verification error: %s", e, exc_info=True)
             return create_response(
                 error="An error occurred during token verification",
                 error_code="token_verification_error",
@@ -332,13 +400,10 @@ class VerifyTokenView(APIView):
 class UserProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
+    @method_decorator(vary_on_headers('Authorization'))
     def get(self, request):
         """Get user profile information"""
-        serializer = UserProfileSerializer(
-            request.user,
-            context={'request': request}
-        )
-        return create_response(data={"user": serializer.data})
+        return create_response(data={"user": get_serialized_profile(request.user, request)})
 
     def patch(self, request):
         """Update user profile (partial update)"""
@@ -358,15 +423,15 @@ class UserProfileView(APIView):
                 )
 
             updated_user = serializer.save()
-            logger.info(f"Profile updated for user {request.user.email}")
+            logger.info("Profile updated for user %s", request.user.email)
 
             return create_response(
-                data={"user": UserProfileSerializer(updated_user, context={'request': request}).data},
+                data={"user": get_serialized_profile(updated_user, request)},
                 message="Profile updated successfully"
             )
 
         except Exception as e:
-            logger.error(f"Profile update failed: {str(e)}", exc_info=True)
+            logger.error("Profile update failed: %s", e, exc_info=True)
             return create_response(
                 error="Profile update failed",
                 error_code="profile_update_failed",
@@ -377,26 +442,18 @@ class UserProfileView(APIView):
 class PublicProfileView(APIView):
     permission_classes = [AllowAny]
 
+    # Public data is the same for every viewer, so a short shared cache is safe
+    @method_decorator(cache_page(60 * 5))
     def get(self, request, user_id):
         """Get public profile information for a user"""
         try:
-            user = get_object_or_404(User, uuid=user_id)
-            serializer = UserProfileSerializer(user, context={'request': request})
-            data = serializer.data
-
-            # Filter out sensitive information
-            sensitive_fields = [
-                'email', 'is_verified', 'phone_number', 'date_of_birth',
-                'address', 'tax_id', 'credit_limit', 'company_registration'
-            ]
-            for field in sensitive_fields:
-                if field in data:
-                    data.pop(field)
+            user = get_object_or_404(User.objects.select_related('profile'), uuid=user_id)
+            serializer = PublicProfileSerializer(user, context={'request': request})
 
-            return create_response(data={"user": data})
+            return create_response(data={"user": serializer.data})
 
         except Exception as e:
-            logger.error(f"Error fetching public profile: {str(e)}", exc_info=True)
+            logger.error("Error fetching public profile: %s", e, exc_info=True)
             return create_response(
                 error="Error fetching profile",
                 error_code="profile_fetch_error",
@@ -418,50 +475,35 @@ class PasswordResetRequestView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
+        # Checked before the user lookup so unknown emails are limited the same way
+        ip = request.META.get('REMOTE_ADDR', '')
+        if not rate_limit(f"pwreset:{email}", 1, 300) or not rate_limit(f"pwreset:ip:{ip}", 5, 3600):
+            return create_response(
+                error="Please wait 5 minutes before requesting another reset",
+                error_code="rate_limit",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
         try:
             try:
-                user = User.objects.get(email=email)
-
-                # Check for recent reset requests
-                if user.reset_code_created:
-                    time_since_last_request = timezone.now() - user.reset_code_created
-                    if time_since_last_request < timedelta(minutes=5):
-                        wait_minutes = 5 - (time_since_last_request.seconds // 60)
-                        return create_response(
-                            error=f"Please wait {wait_minutes} minutes before requesting another reset",
-                            error_code="rate_limit",
-                            status_code=status.HTTP_429_TOO_MANY_REQUESTS
-                        )
+                user = get_user_by_email(email, auth_only=True)
 
                 # Generate reset code using model method
                 reset_code = user.generate_reset_code()
 
-                try:
-                    context = {
-                        'user_name': f"{user.first_name} {user.last_name}",
-                        'reset_code': reset_code,
-                        'expiry_hours': 1
-                    }
-                    send_password_reset_email(user.email, reset_code, context)
-                    logger.info(f"Password reset email sent to {user.email}")
-
-                except EmailRateLimitExceeded as e:
-                    return create_response(
-                        error=str(e),
-                        error_code="rate_limit_exceeded",
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS
-                    )
-                except Exception as email_error:
-                    logger.error(f"Failed to send reset email: {str(email_error)}", exc_info=True)
-                    return create_response(
-                        error="Failed to send reset email",
-                        error_code="email_sending_failed",
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-                    )
+                context = {
+                    'user_name': f"{user.first_name} {user.last_name}",
+                    'reset_code': reset_code,
+                    'expiry_hours': 1
+                }
+                transaction.on_commit(
+                    lambda: send_password_reset_email_task.delay(user.email, reset_code, context),
+                    robust=True
+                )
 
             except User.DoesNotExist:
                 # Return same message for security
-                logger.info(f"Password reset requested for non-existent email: {email}")
+                logger.info("Password reset requested for non-existent email: %s", email)
 
             # Always return success to prevent email enumeration
             return create_response(
@@ -469,7 +511,7 @@ class PasswordResetRequestView(APIView):
             )
 
         except Exception as e:
-            logger.error(f"Password reset request failed: {str(e)}", exc_info=True)
+            logger.error("Password reset request failed: %s", e, exc_info=True)
             return create_response(
                 error="An unexpected error occurred",
                 error_code="server_error",
@@ -493,7 +535,7 @@ class VerifyResetCodeView(APIView):
             )
 
         try:
-            user = User.objects.get(email=email)
+            user = get_user_by_email(email, auth_only=True)
 
             # Check code validity
             if not user.reset_code_created or user.reset_code != reset_code:
@@ -521,7 +563,7 @@ class VerifyResetCodeView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error verifying reset code: {str(e)}", exc_info=True)
+            logger.error("Error verifying reset code: %s", e, exc_info=True)
             return create_response(
                 error="An unexpected error occurred",
                 error_code="server_error",
@@ -555,19 +597,21 @@ class ResetPasswordView(APIView):
             )
 
         try:
-            user = User.objects.get(email=email)
+            user = get_user_by_email(email)
 
             # Use model method for password reset
             if user.reset_password(reset_code, new_password):
+                clear_token_cache(user.pk)
+
                 # Generate JWT tokens
                 tokens = get_tokens_for_user(user)
 
-                logger.info(f"Password reset successful for user {user.email}")
+                logger.info("Password reset successful for user %s", user.email)
                 return create_response(
                     message="Password reset successfully",
                     data={
                         'tokens': tokens,
-                        'user': UserProfileSerializer(user, context={'request': request}).data
+                        'user': get_serialized_profile(user, request)
                     }
                 )
             else:
@@ -584,7 +628,7 @@ class ResetPasswordView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Password reset failed: {str(e)}", exc_info=True)
+            logger.error("Password reset failed: %s", e, exc_info=True)
             return create_response(
                 error="An unexpected error occurred",
                 error_code="server_error",
@@ -627,18 +671,19 @@ class ChangePasswordView(APIView):
         try:
             # Update password
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=['password'])
+            clear_token_cache(user.pk)
 
             # Generate new JWT tokens
             tokens = get_tokens_for_user(user)
 
-            logger.info(f"Password changed successfully for user {user.email}")
+            logger.info("Password changed successfully for user %s", user.email)
             return create_response(
                 message="Password changed successfully",
                 data={'tokens': tokens}
             )
         except Exception as e:
-            logger.error(f"Password change failed: {str(e)}", exc_info=True)
+            logger.error("Password change failed: %s", e, exc_info=True)
             return create_response(
                 error="Password change failed",
                 error_code="server_error",
@@ -648,6 +693,7 @@ class ChangePasswordView(APIView):
 
 class ResendVerificationView(APIView):
     permission_classes = [AllowAny]
+    throttle_scope = 'resend_verification'
 
     def post(self, request):
         """Resend verification email to user"""
@@ -662,51 +708,35 @@ class ResendVerificationView(APIView):
 
         try:
             try:
-                user = User.objects.get(email=email)
+                user = get_user_by_email(email, auth_only=True)
 
                 if user.is_verified:
                     return create_response(message="Email is already verified")
 
-                # Check for recent verification requests
-                if user.verification_code_created:
-                    time_since_last_request = timezone.now() - user.verification_code_created
-                    if time_since_last_request < timedelta(minutes=5):
-                        wait_minutes = 5 - (time_since_last_request.seconds // 60)
-                        return create_response(
-                            error=f"Please wait {wait_minutes} minutes before requesting another verification email",
-                            error_code="rate_limit",
-                            status_code=status.HTTP_429_TOO_MANY_REQUESTS
-                        )
+                # One resend per 5 minutes, enforced atomically in the shared cache
+                if not rate_limit(f"resend_verification:{email}", 1, 300):
+                    return create_response(
+                        error="Please wait 5 minutes before requesting another verification email",
+                        error_code="rate_limit",
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS
+                    )
 
                 # Generate verification code
                 verification_code = user.generate_verification_code()
 
-                try:
-                    context = {
-                        'user_name': f"{user.first_name} {user.last_name}",
-                        'verification_code': verification_code,
-                        'expiry_hours': 24
-                    }
-                    send_verification_email(user.email, verification_code, context)
-                    logger.info(f"Verification email resent to {user.email}")
-
-                except EmailRateLimitExceeded as e:
-                    return create_response(
-                        error=str(e),
-                        error_code="rate_limit_exceeded",
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS
-                    )
-                except Exception as email_error:
-                    logger.error(f"Failed to resend verification email: {str(email_error)}", exc_info=True)
-                    return create_response(
-                        error="Failed to send verification email",
-                        error_code="email_sending_failed",
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-                    )
+                context = {
+                    'user_name': f"{user.first_name} {user.last_name}",
+                    'verification_code': verification_code,
+                    'expiry_hours': 24
+                }
+                transaction.on_commit(
+                    lambda: send_verification_email_task.delay(user.email, verification_code, context),
+                    robust=True
+                )
 
             except User.DoesNotExist:
                 # Don't reveal if email exists
-                logger.info(f"Verification resend requested for non-existent email: {email}")
+                logger.info("Verification resend requested for non-existent email: %s", email)
 
             # Always return success for security
             return create_response(
@@ -714,7 +744,7 @@ class ResendVerificationView(APIView):
             )
 
         except Exception as e:
-            logger.error(f"Error resending verification email: {str(e)}", exc_info=True)
+            logger.error("Error resending verification email: %s", e, exc_info=True)
             return create_response(
                 error="An unexpected error occurred",
                 error_code="server_error",
@@ -746,38 +776,65 @@ class UpdateAvatarView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
-        # Validate file type
-        allowed_types = ['image/jpeg', 'image/png', 'image/gif']
-        if avatar_file.content_type not in allowed_types:
+        # Read the upload once; validation, hashing and storage all use this buffer
+        content = ContentFile(avatar_file.read())
+
+        # Validate file type from its magic bytes, not the client-supplied content type
+        mime_type = detect_image_type(content)
+        if mime_type is None:
             return create_response(
                 error="Invalid file type. Allowed types: JPEG, PNG, GIF",
                 error_code="invalid_file_type",
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
+        try:
+            Image.open(content).verify()
+        except Exception:
+            return create_response(
+                error="Invalid or corrupted image file",
+                error_code="invalid_file_type",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+        content.seek(0)
+
         try:
             user = request.user
+            old_avatar = user.avatar.name if user.avatar else None
 
-            # Delete old avatar file if it exists
-            if user.avatar:
-                try:
-                    storage, path = user.avatar.storage, user.avatar.path
-                    storage.delete(path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete old avatar: {str(e)}")
+            # Name the file after its content so re-uploading the same image is a no-op
+            digest = hashlib.blake2b(content.read(), digest_size=16).hexdigest()
+            content.seek(0)
+            new_avatar = user_avatar_content_path(user, digest, IMAGE_EXTENSIONS[mime_type])
 
-            # Save new avatar
-            user.avatar = avatar_file
-            user.save()
+            if new_avatar == old_avatar:
+                return create_response(
+                    data={"user": get_serialized_profile(user, request)},
+                    message="Avatar updated successfully"
+                )
+
+            storage = user.avatar.storage
+            if not storage.exists(new_avatar):
+                new_avatar = storage.save(new_avatar, content)
+
+            # Point the user at the new file; the old one is removed in the background once committed
+            with transaction.atomic():
+                user.avatar.name = new_avatar
+                user.save(update_fields=['avatar'])
+                if old_avatar:
+                    transaction.on_commit(
+                        lambda: delete_storage_file_task.delay(old_avatar),
+                        robust=True
+                    )
 
-            logger.info(f"Avatar updated for user {user.email}")
+            logger.info("Avatar updated for user %s", user.email)
             return create_response(
-                data={"user": UserProfileSerializer(user, context={'request': request}).data},
+                data={"user": get_serialized_profile(user, request)},
                 message="Avatar updated successfully"
             )
 
         except Exception as e:
-            logger.error(f"Failed to update avatar: {str(e)}", exc_info=True)
+            logger.error("Failed to update avatar: %s", e, exc_info=True)
             return create_response(
                 error="Failed to update avatar",
                 error_code="avatar_update_failed",
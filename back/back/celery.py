@@ -0,0 +1,16 @@
+# back/celery.py
+
+import os
+
+from celery import Celery
+
+# Set the Django settings module
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'back.settings')
+
+app = Celery('back')
+
+# Read CELERY_* options from Django settings
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Pick up tasks.py modules from installed apps
+app.autodiscover_tasks()
@@ -0,0 +1,28 @@
+# back/log_handlers.py
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    Format records on the calling thread and hand them to a background
+    listener that owns the actual FileHandler.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False):
+        super().__init__(queue.SimpleQueue())
+        self.file_handler = logging.FileHandler(filename, mode=mode, encoding=encoding, delay=delay)
+        self.listener = QueueListener(self.queue, self.file_handler)
+        self.listener.start()
+        # Drain queued records before the interpreter exits
+        atexit.register(self.close)
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.file_handler.close()
+        super().close()
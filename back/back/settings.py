@@ -22,7 +22,10 @@ if not SECRET_KEY:
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
 
-ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
+# Django matches hosts against a list (wildcards allowed), so just normalize the entries once
+ALLOWED_HOSTS = [
+    host.strip() for host in os.getenv('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',') if host.strip()
+]
 
 # Application definition
 INSTALLED_APPS = [
@@ -54,6 +57,8 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    # ETag on GET responses; unchanged bodies come back as 304 Not Modified
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -82,13 +87,50 @@ WSGI_APPLICATION = 'back.wsgi.application'
 ASGI_APPLICATION = 'back.asgi.application'
 
 # Database configuration
-# Using SQLite with foreign key support
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# PostgreSQL when DB_NAME is set, otherwise SQLite for local development
+DB_NAME = os.getenv('DB_NAME')
+
+if DB_NAME:
+    # Set DB_PGBOUNCER=True when connecting through pgbouncer in transaction pooling mode
+    DB_PGBOUNCER = os.getenv('DB_PGBOUNCER', 'False').lower() == 'true'
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': DB_NAME,
+            'USER': os.getenv('DB_USER', ''),
+            'PASSWORD': os.getenv('DB_PASSWORD', ''),
+            'HOST': os.getenv('DB_HOST', 'localhost'),
+            'PORT': os.getenv('DB_PORT', '6432' if DB_PGBOUNCER else '5432'),
+            'OPTIONS': {'sslmode': os.getenv('DB_SSLMODE', 'prefer')},
+            # pgbouncer pools connections itself and cannot hold cursors across transactions
+            'CONN_MAX_AGE': 0 if DB_PGBOUNCER else int(os.getenv('DB_CONN_MAX_AGE', 600)),
+            'CONN_HEALTH_CHECKS': True,
+            'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER,
+            'ATOMIC_REQUESTS': False,
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            # Reuse connections across requests
+            'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 600)),
+            'CONN_HEALTH_CHECKS': True,
+            # WAL lets readers run alongside the writer; NORMAL syncs at checkpoints instead of every commit
+            'OPTIONS': {
+                'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            },
+        }
     }
-}
+
+# Password hashing: Argon2 first; existing PBKDF2 hashes are upgraded on next login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -139,16 +181,29 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': (
             'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+            'back.renderers.ORJSONRenderer',
+            *(('rest_framework.renderers.BrowsableAPIRenderer',) if DEBUG else ()),
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+            'back.renderers.ORJSONParser',
+            'rest_framework.parsers.FormParser',
+            'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'rest_framework.throttling.UserRateThrottle',
+        'rest_framework.throttling.ScopedRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
-        'user': '1000/day'
+        'user': '1000/day',
+        # Per-endpoint scopes (views set throttle_scope)
+        'login': '5/min',
+        'resend_verification': '2/min',
     }
 }
 
@@ -157,7 +212,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # LoginView records last_login itself with a single-column UPDATE
+    'UPDATE_LAST_LOGIN': False,
 
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -168,12 +224,28 @@ SIMPLE_JWT = {
 }
 
 
+# Shared Redis for channel layers, cache and Celery (unset in local development)
+REDIS_URL = os.getenv('REDIS_URL')
+
 # Channel layers for WebSockets
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
+if REDIS_URL:
+    # Shared across ASGI workers so group_send reaches every connected consumer
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {
+                'hosts': [REDIS_URL],
+                'capacity': 1500,
+                'expiry': 10,
+            },
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        }
     }
-}
 
 
 # CORS settings
@@ -244,12 +316,34 @@ if not DEBUG:
 
 
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',  # Bypass caching in dev
-        # 'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+if REDIS_URL:
+    # Shared across workers so cached lookups and rate limits stay consistent
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
     }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',  # Bypass caching in dev
+            # 'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
+    }
+
+
+# Celery (background email delivery and other out-of-request work)
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', REDIS_URL)
+CELERY_TASK_IGNORE_RESULT = True
+# Without a broker, run tasks inline so development works without a worker
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+# Account emails get their own queue so SMTP slowness can't hold up other tasks.
+# Workers must consume it alongside the default queue: celery -A back worker -Q celery,mail
+CELERY_TASK_ROUTES = {
+    'accounts.tasks.send_verification_email_task': {'queue': 'mail'},
+    'accounts.tasks.send_password_reset_email_task': {'queue': 'mail'},
 }
 
 
@@ -273,7 +367,8 @@ LOGGING = {
             'formatter': 'verbose'
         },
         'file': {
-            'class': 'logging.FileHandler',
+            # Writes happen on a listener thread so requests never wait on disk
+            'class': 'back.log_handlers.QueuedFileHandler',
             'filename': 'debug.log',
             'formatter': 'verbose'
         },
@@ -285,7 +380,7 @@ LOGGING = {
         },
         'accounts': {  # For your accounts app
             'handlers': ['console', 'file'],
-            'level': 'DEBUG',  # Set to DEBUG for more detailed logs
+            'level': os.getenv('ACCOUNTS_LOG_LEVEL', 'DEBUG' if DEBUG else 'INFO'),
             'propagate': False,
         },
     },
@@ -2,15 +2,21 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from django.urls import reverse
-from django.db import models
+from django.core.paginator import Paginator, EmptyPage
+from django.db import models, connections
+from django.utils.functional import cached_property
+from django.db.models import Q, Case, When, Value, BooleanField
+from django.db.models.functions import Now
 from django.forms import Textarea, Select
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 
 from .models import (
     Property, Auction, Bid, Document, Contract,
     MessageThread, ThreadParticipant, Message, Notification,
     Media
 )
+from .utils import update_auction_statuses, recount_thread_counters
 
 # Generic Media Inline for all models
 class MediaInline(GenericTabularInline):
@@ -19,8 +25,136 @@ class MediaInline(GenericTabularInline):
     fields = ['file', 'name', 'media_type']
     readonly_fields = ['uploaded_at']
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Use PostgreSQL's planner estimate for unfiltered changelists on large
+    tables instead of an exact COUNT(*) over every row.
+
+    The estimate only sizes the page links; the last page, and anything past
+    it, is bounded by an exact count so stale statistics can't hide rows.
+    """
+    # Below this many rows an exact count is cheap and the estimate isn't worth showing
+    estimate_threshold = 10000
+    is_estimated = False
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql' or queryset.query.where:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        if not row or row[0] <= self.estimate_threshold:
+            return None
+        # Statistics can lag a mass delete; confirm the table really is past the threshold
+        # with a bounded count so "Show all" and single-page lists are still gated exactly
+        if queryset.order_by()[:self.estimate_threshold + 1].count() <= self.estimate_threshold:
+            return None
+        return int(row[0])
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        self.is_estimated = estimate is not None
+        return estimate if self.is_estimated else super().count
+
+    def _past_real_end(self, number):
+        # The bounded count in _estimated_count guarantees rows up to the threshold,
+        # so only deeper pages need a probe for an estimate that overshoots
+        bottom = (number - 1) * self.per_page
+        return bottom >= self.estimate_threshold and not self.object_list[bottom:bottom + 1].exists()
+
+    def page(self, number):
+        try:
+            number = self.validate_number(number)
+            on_last_page = number >= self.num_pages
+        except EmptyPage:
+            on_last_page = True
+        if self.is_estimated and (on_last_page or self._past_real_end(number)):
+            # Recount exactly so the final page neither truncates nor rejects real rows
+            for name in ('count', 'num_pages'):
+                self.__dict__.pop(name, None)
+            self.is_estimated = False
+            self.__dict__['count'] = super().count
+        return super().page(number)
+
+class ExpiredListFilter(admin.SimpleListFilter):
+    """Filter on whether a date column is in the past, compared against the database clock."""
+    title = _('Expired')
+    parameter_name = 'expired'
+    date_field = 'expiry_date'
+
+    def lookups(self, request, model_admin):
+        return (('yes', _('Yes')), ('no', _('No')))
+
+    def queryset(self, request, queryset):
+        lookup = {f'{self.date_field}__lt': Now()}
+        if self.value() == 'yes':
+            return queryset.filter(**lookup)
+        if self.value() == 'no':
+            return queryset.exclude(**lookup)
+        return queryset
+
+class EndedListFilter(ExpiredListFilter):
+    title = _('Ended')
+    parameter_name = 'ended'
+    date_field = 'end_date'
+
 # Base Admin Configuration
 class BaseModelAdmin(admin.ModelAdmin):
+    # Large columns the changelist never renders; the change form still loads them
+    changelist_defer_fields = []
+
+    def get_changelist(self, request, **kwargs):
+        changelist = super().get_changelist(request, **kwargs)
+        defer_fields = self.changelist_defer_fields
+        if not defer_fields:
+            return changelist
+
+        class DeferredChangeList(changelist):
+            def get_queryset(self, request, *args, **kwargs):
+                return super().get_queryset(request, *args, **kwargs).defer(*defer_fields)
+
+        return DeferredChangeList
+
+    # Text columns searched with PostgreSQL full-text search instead of icontains
+    full_text_search_fields = []
+
+    def get_search_results(self, request, queryset, search_term):
+        if not (self.full_text_search_fields and search_term and
+                connections[queryset.db].vendor == 'postgresql'):
+            return super().get_search_results(request, queryset, search_term)
+
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        # Same expression as the GIN indexes created in BaseConfig, so the planner can use them
+        query = SearchQuery(search_term, config='simple', search_type='websearch')
+        condition = Q()
+        annotations = {}
+        for field_name in self.full_text_search_fields:
+            alias = f'_search_{field_name}'
+            annotations[alias] = SearchVector(field_name, config='simple')
+            condition |= Q(**{alias: query})
+        return queryset.alias(**annotations).filter(condition), False
+
+    def update_in_batches(self, queryset, batch_size=10000, **values):
+        """UPDATE the selection in pk batches so huge selections don't hold one long write."""
+        # Fetch one batch of pks at a time rather than the whole selection up front
+        pks_query = queryset.order_by('pk').values_list('pk', flat=True)
+        updated = 0
+        last_pk = None
+        while True:
+            batch = pks_query if last_pk is None else pks_query.filter(pk__gt=last_pk)
+            pks = list(batch[:batch_size])
+            if not pks:
+                return updated
+            updated += self.model.objects.filter(pk__in=pks).update(**values)
+            last_pk = pks[-1]
+
     def save_model(self, request, obj, form, change):
         if not obj.pk:
             obj.created_by = request.user
@@ -46,6 +180,14 @@ class PropertyAdmin(BaseModelAdmin):
         'is_published', 
     ]
     search_fields = ['title', 'address', 'city', 'property_number']
+    list_select_related = ['owner']
+    autocomplete_fields = ['owner']
+    changelist_defer_fields = [
+        'description', 'location', 'highQualityStreets', 'features', 'amenities',
+        'rooms', 'specifications', 'pricing_details', 'metadata'
+    ]
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     inlines = [MediaInline]
     fieldsets = (
         (_('Basic Information'), {
@@ -84,12 +226,26 @@ class AuctionAdmin(BaseModelAdmin):
     list_filter = [
         'auction_type', 
         'status', 
+        EndedListFilter,
         'start_date',
         'end_date'
     ]
     search_fields = ['title', 'related_property__title']
+    autocomplete_fields = ['related_property']
+    changelist_defer_fields = [
+        'description', 'viewing_dates', 'timeline', 'bid_history', 'financial_terms',
+        'terms_conditions', 'special_notes', 'analytics'
+    ]
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     inlines = [MediaInline]
     readonly_fields = ['bid_count', 'view_count']
+    actions = ['update_auction_status']
+
+    def update_auction_status(self, request, queryset):
+        updated = update_auction_statuses(queryset)
+        self.message_user(request, _("%(count)d auction statuses updated.") % {'count': updated})
+    update_auction_status.short_description = _("Update status of selected auctions from their dates")
 
 # Bid Admin
 @admin.register(Bid)
@@ -101,8 +257,15 @@ class BidAdmin(BaseModelAdmin):
         'bid_time', 
         'status'
     ]
-    list_filter = ['status', 'bid_time']
+    list_filter = ['status', ('bid_time', admin.DateFieldListFilter)]
     search_fields = ['auction__title', 'bidder__email']
+    list_select_related = ['auction', 'bidder']
+    autocomplete_fields = ['auction', 'bidder']
+    changelist_defer_fields = ['user_agent', 'notes', 'metadata', 'payment_info']
+    # Large, fast-growing table: skip the unfiltered COUNT(*) and keep pages small
+    show_full_result_count = False
+    list_per_page = 50
+    paginator = EstimatedCountPaginator
 
     def bidder_display(self, obj):
         return obj.bidder.get_full_name() if obj.bidder else _('Unknown')
@@ -123,6 +286,13 @@ class DocumentAdmin(BaseModelAdmin):
         'verification_status', 
     ]
     search_fields = ['title', 'document_number']
+    list_select_related = ['uploaded_by']
+    autocomplete_fields = [
+        'related_property', 'related_auction', 'related_contract', 'uploaded_by', 'verified_by'
+    ]
+    changelist_defer_fields = [
+        'description', 'verification_notes', 'verification_details', 'document_metadata'
+    ]
     inlines = [MediaInline]
 
     def uploaded_by_display(self, obj):
@@ -146,6 +316,12 @@ class ContractAdmin(BaseModelAdmin):
         'contract_date'
     ]
     search_fields = ['title', 'contract_number']
+    list_select_related = ['buyer', 'seller']
+    autocomplete_fields = ['related_property', 'related_auction', 'buyer', 'seller', 'verified_by']
+    changelist_defer_fields = [
+        'description', 'timeline', 'payment_terms', 'payment_details', 'payments_history',
+        'special_conditions', 'parties'
+    ]
     inlines = [MediaInline]
 
     def buyer_display(self, obj):
@@ -164,15 +340,27 @@ class MessageThreadAdmin(BaseModelAdmin):
         'thread_type', 
         'status', 
         'creator_display', 
+        'participant_count',
+        'message_count',
         'last_message_at'
     ]
     list_filter = ['thread_type', 'status']
     search_fields = ['subject']
+    list_select_related = ['creator']
+    autocomplete_fields = ['creator', 'related_property', 'related_auction']
+    changelist_defer_fields = ['metadata']
+    readonly_fields = ['participant_count', 'message_count']
+    actions = ['recount_counters']
 
     def creator_display(self, obj):
         return obj.creator.get_full_name() if obj.creator else _('Unknown')
     creator_display.short_description = _('Creator')
 
+    def recount_counters(self, request, queryset):
+        updated = recount_thread_counters(queryset)
+        self.message_user(request, _("%(count)d thread counters recalculated.") % {'count': updated})
+    recount_counters.short_description = _("Recalculate message and participant counts")
+
 # Message Admin
 @admin.register(Message)
 class MessageAdmin(BaseModelAdmin):
@@ -183,7 +371,16 @@ class MessageAdmin(BaseModelAdmin):
         'sent_at', 
         'status'
     ]
-    list_filter = ['message_type', 'status', 'sent_at']
+    list_filter = ['message_type', 'status', ('sent_at', admin.DateFieldListFilter)]
+    search_fields = ['content']
+    full_text_search_fields = ['content']
+    list_select_related = ['thread', 'sender']
+    autocomplete_fields = ['thread', 'sender']
+    raw_id_fields = ['reply_to']
+    changelist_defer_fields = ['metadata']
+    show_full_result_count = False
+    list_per_page = 50
+    paginator = EstimatedCountPaginator
 
     def sender_display(self, obj):
         return obj.sender.get_full_name() if obj.sender else _('Unknown')
@@ -197,23 +394,56 @@ class NotificationAdmin(BaseModelAdmin):
         'recipient_display', 
         'notification_type', 
         'is_read', 
-        'is_important'
+        'is_important',
+        'is_expired'
     ]
     list_filter = [
         'notification_type', 
         'is_read', 
         'is_important', 
+        ExpiredListFilter,
     ]
-    actions = ['mark_as_read']
+    search_fields = ['title', 'content']
+    full_text_search_fields = ['title', 'content']
+    list_select_related = ['recipient']
+    changelist_defer_fields = ['content', 'notification_data']
+    autocomplete_fields = [
+        'recipient', 'related_thread', 'related_auction', 'related_property', 'related_contract'
+    ]
+    show_full_result_count = False
+    list_per_page = 50
+    paginator = EstimatedCountPaginator
+    actions = ['mark_as_read', 'mark_as_sent']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _is_expired=Case(
+                When(expiry_date__lt=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+
+    def is_expired(self, obj):
+        return obj._is_expired
+    is_expired.short_description = _('Expired')
+    is_expired.boolean = True
+    is_expired.admin_order_field = '_is_expired'
 
     def recipient_display(self, obj):
         return obj.recipient.get_full_name() if obj.recipient else _('Unknown')
     recipient_display.short_description = _('Recipient')
 
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
+        updated = self.update_in_batches(queryset.filter(is_read=False), is_read=True, read_at=Now())
+        self.message_user(request, _("%(count)d notifications marked as read.") % {'count': updated})
     mark_as_read.short_description = _("Mark selected notifications as read")
 
+    def mark_as_sent(self, request, queryset):
+        updated = self.update_in_batches(queryset.filter(is_sent=False), is_sent=True, sent_at=Now())
+        self.message_user(request, _("%(count)d notifications marked as sent.") % {'count': updated})
+    mark_as_sent.short_description = _("Mark selected notifications as sent")
+
 # Media Admin
 @admin.register(Media)
 class MediaAdmin(BaseModelAdmin):
@@ -227,6 +457,19 @@ class MediaAdmin(BaseModelAdmin):
     list_filter = ['media_type']
     search_fields = ['name']
 
+    def get_queryset(self, request):
+        # Load the generic targets in one query per content type instead of one per row,
+        # reading only the columns their __str__ needs
+        return super().get_queryset(request).prefetch_related(
+            GenericPrefetch('content_object', [
+                Property.objects.only('id', 'title'),
+                Auction.objects.only('id', 'title'),
+                Document.objects.only('id', 'title'),
+                Contract.objects.only('id', 'title'),
+                Message.objects.select_related('sender').only('id', 'content', 'sender'),
+            ])
+        )
+
     def content_object_repr(self, obj):
         if obj.content_object:
             return str(obj.content_object)
@@ -1,6 +1,94 @@
 from django.apps import AppConfig
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+from django.db.backends.utils import truncate_name
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.signals import post_migrate
+
+
+# Columns behind admin search_fields. icontains compiles to
+# UPPER(col::text) LIKE UPPER('%q%'), so the trigram index is built on that expression.
+TRIGRAM_SEARCH_FIELDS = {
+    'accounts.CustomUser': ['email', 'first_name', 'last_name'],
+    'base.Property': ['title', 'address', 'city'],
+    'base.Auction': ['title'],
+    'base.Document': ['title'],
+    'base.Contract': ['title'],
+    'base.MessageThread': ['subject'],
+}
+
+# Long text bodies searched with PostgreSQL full-text search in the admin. The
+# expression must match what SearchVector(field, config='simple') compiles to.
+FULL_TEXT_SEARCH_FIELDS = {
+    'base.Message': ['content'],
+    'base.Notification': ['title', 'content'],
+}
+
+
+def create_search_indexes(sender, app_config=None, using='default', apps=None, **kwargs):
+    """Create trigram and full-text GIN indexes for admin search columns (PostgreSQL only)."""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for label, field_names in TRIGRAM_SEARCH_FIELDS.items():
+            model = (apps or sender.apps).get_model(label)
+            table = model._meta.db_table
+            for field_name in field_names:
+                column = model._meta.get_field(field_name).column
+                index_name = truncate_name(f'{table}_{column}_trgm', connection.ops.max_name_length())
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {qn(index_name)} ON {qn(table)} '
+                    f'USING gin ((UPPER({qn(column)}::text)) gin_trgm_ops)'
+                )
+
+        for label, field_names in FULL_TEXT_SEARCH_FIELDS.items():
+            model = (apps or sender.apps).get_model(label)
+            table = model._meta.db_table
+            for field_name in field_names:
+                column = model._meta.get_field(field_name).column
+                index_name = truncate_name(f'{table}_{column}_fts', connection.ops.max_name_length())
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS {qn(index_name)} ON {qn(table)} '
+                    f"USING gin (to_tsvector('simple'::regconfig, COALESCE({qn(column)}, '')))"
+                )
+
+
+def backfill_thread_counters(sender, app_config=None, using='default', apps=None, **kwargs):
+    """
+    Fill MessageThread.message_count/participant_count for threads whose
+    counters are still at the column default while they have rows to count,
+    e.g. threads created before the columns existed. Idempotent.
+    """
+    from .models import thread_counter_expressions
+
+    thread_model = (apps or sender.apps).get_model('base', 'MessageThread')
+    try:
+        thread_model._meta.get_field('message_count')
+    except FieldDoesNotExist:
+        return
+    message_model = thread_model._meta.get_field('messages').related_model
+    participant_model = thread_model._meta.get_field('participants').related_model
+
+    stale = thread_model._default_manager.using(using).alias(
+        has_messages=Exists(message_model._default_manager.filter(thread=OuterRef('pk'))),
+        has_participants=Exists(
+            participant_model._default_manager.filter(thread=OuterRef('pk'), is_active=True)
+        ),
+    ).filter(
+        Q(message_count=0, has_messages=True) | Q(participant_count=0, has_participants=True)
+    )
+    stale.update(**thread_counter_expressions(thread_model))
 
 
 class BaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base'
+
+    def ready(self):
+        # Migrations are generated per environment, so vendor-specific indexes are created here
+        post_migrate.connect(create_search_indexes, sender=self)
+        post_migrate.connect(backfill_thread_counters, sender=self)
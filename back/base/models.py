@@ -1,7 +1,11 @@
 import os
 import uuid
 from datetime import datetime
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.conf import settings
 from django.utils import timezone
 from django.core.validators import (
@@ -57,6 +61,9 @@ class RoleChoices:
         (INSPECTOR, _('Property Inspector')),
         (BIDDER, _('Bidder')),
     ]
+
+    # Built once at import instead of per lookup
+    LABELS = dict(CHOICES)
 # -------------------------------------------------------------------------
 # Media Model
 # -------------------------------------------------------------------------
@@ -115,6 +122,11 @@ class Media(models.Model):
         verbose_name = "الملف"
         verbose_name_plural = "الملفات و الصور"
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id']),
+            models.Index(fields=['-uploaded_at']),
+            models.Index(fields=['media_type']),
+        ]
 
 
 # -------------------------------------------------------------------------
@@ -173,6 +185,11 @@ class MessageThread(models.Model):
     is_system_thread = models.BooleanField(_('محادثة نظام'), default=False)
     last_message_at = models.DateTimeField(_('وقت آخر رسالة'), null=True, blank=True)
 
+    # Denormalized counters, kept current by Message/ThreadParticipant save and delete.
+    # participant_count only counts active participants, like the thread list filter
+    message_count = models.PositiveIntegerField(_('عدد الرسائل'), default=0)
+    participant_count = models.PositiveIntegerField(_('عدد المشاركين'), default=0)
+
     # Additional metadata for API
     metadata = models.JSONField(
         _('بيانات إضافية'),
@@ -252,6 +269,13 @@ class ThreadParticipant(models.Model):
     def __str__(self):
         return f"{self.user.email} in {self.thread.subject}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Recount rather than increment: saves can also toggle is_active
+        MessageThread.objects.filter(pk=self.thread_id).update(
+            participant_count=thread_counter_expressions(MessageThread)['participant_count']
+        )
+
 
 class Message(models.Model):
     """Model for messages in threads"""
@@ -329,6 +353,7 @@ class Message(models.Model):
         indexes = [
             models.Index(fields=['thread', 'sent_at']),
             models.Index(fields=['sender', 'sent_at']),
+            models.Index(fields=['sent_at']),
             models.Index(fields=['status']),
         ]
 
@@ -350,10 +375,50 @@ class Message(models.Model):
         # Save the message
         super().save(*args, **kwargs)
 
-        # Update thread last_message_at
+        # Update thread last_message_at and message count in one UPDATE
         if is_new and self.thread:
             self.thread.last_message_at = self.sent_at
-            self.thread.save(update_fields=['last_message_at'])
+            MessageThread.objects.filter(pk=self.thread_id).update(
+                last_message_at=self.sent_at,
+                message_count=F('message_count') + 1
+            )
+
+
+def thread_counter_expressions(thread_model):
+    """
+    Return subquery expressions that recompute a thread's message_count and
+    participant_count from its rows, for use in MessageThread UPDATEs.
+
+    The related models are looked up from thread_model so historical models
+    in migrations and post_migrate handlers work too.
+    """
+    def count_of(related_name, **filters):
+        related_model = thread_model._meta.get_field(related_name).related_model
+        counts = (
+            related_model._default_manager.filter(thread=OuterRef('pk'), **filters)
+            .order_by().values('thread').annotate(total=Count('pk')).values('total')
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    return {
+        'message_count': count_of('messages'),
+        'participant_count': count_of('participants', is_active=True),
+    }
+
+
+# post_delete also fires for queryset and cascade deletes, unlike Model.delete()
+@receiver(post_delete, sender=Message)
+def _decrement_message_count(sender, instance, **kwargs):
+    MessageThread.objects.filter(pk=instance.thread_id, message_count__gt=0).update(
+        message_count=F('message_count') - 1
+    )
+
+
+@receiver(post_delete, sender=ThreadParticipant)
+def _recount_participants(sender, instance, **kwargs):
+    MessageThread.objects.filter(pk=instance.thread_id).update(
+        participant_count=thread_counter_expressions(MessageThread)['participant_count']
+    )
 
 
 # -------------------------------------------------------------------------
@@ -550,6 +615,7 @@ class Property(models.Model):
             models.Index(fields=['updated_at']),
             # Compound indexes (if you often filter by combinations)
             models.Index(fields=['is_published', 'is_featured']),
+            models.Index(fields=['is_published', '-created_at']),
             models.Index(fields=['city', 'property_type']),
             models.Index(fields=['status', 'market_value']),
         ]
@@ -757,9 +823,11 @@ class Auction(models.Model):
         indexes = [
             models.Index(fields=['slug']),
             models.Index(fields=['status']),
+            models.Index(fields=['auction_type']),
             models.Index(fields=['start_date']),
             models.Index(fields=['end_date']),
             models.Index(fields=['is_published', 'is_featured']),
+            models.Index(fields=['is_published', '-start_date']),
         ]
 
     def __str__(self):
@@ -860,6 +928,8 @@ class Bid(models.Model):
         indexes = [
             models.Index(fields=['auction', '-bid_time']),
             models.Index(fields=['bidder', '-bid_time']),
+            models.Index(fields=['-bid_time']),
+            models.Index(fields=['auction', 'status']),
             models.Index(fields=['status']),
         ]
 
@@ -869,27 +939,31 @@ class Bid(models.Model):
     def save(self, *args, **kwargs):
         # For new bids, update auction stats
         is_new = self.pk is None
-        super().save(*args, **kwargs)
+        if not is_new:
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic():
+            is_highest = not self.auction.current_bid or self.bid_amount > self.auction.current_bid
+
+            # Mark all other bids as outbid and insert this one as winning,
+            # rather than following the INSERT with a second UPDATE of this row
+            if is_highest and self.status == 'accepted':
+                Bid.objects.filter(
+                    auction=self.auction,
+                    status='winning'
+                ).update(status='outbid')
+                self.status = 'winning'
+
+            super().save(*args, **kwargs)
 
-        if is_new:
             # Update auction bid count
             self.auction.bid_count += 1
 
             # Update current bid if this is the highest
-            if not self.auction.current_bid or self.bid_amount > self.auction.current_bid:
+            if is_highest:
                 self.auction.current_bid = self.bid_amount
 
-                # Mark all other bids as outbid
-                if self.status == 'accepted':
-                    Bid.objects.filter(
-                        auction=self.auction,
-                        status='winning'
-                    ).exclude(id=self.id).update(status='outbid')
-
-                    # Mark this as winning
-                    self.status = 'winning'
-                    self.save(update_fields=['status'])
-
             # Update bid history in auction's JSON field
             try:
                 bid_entry = {
@@ -1049,6 +1123,7 @@ class Document(models.Model):
             models.Index(fields=['document_number']),
             models.Index(fields=['document_type']),
             models.Index(fields=['verification_status']),
+            models.Index(fields=['-created_at']),
         ]
 
     def __str__(self):
@@ -1281,13 +1356,12 @@ class Contract(models.Model):
 
         super().save(*args, **kwargs)
 
-        # Update property status if contract is active
-        if self.status == 'active' and self.related_property:
-            self.related_property.status = 'under_contract'
-            self.related_property.save(update_fields=['status'])
-        elif self.status == 'fulfilled' and self.related_property:
-            self.related_property.status = 'sold'
-            self.related_property.save(update_fields=['status'])
+        # Update property status if contract is active; a single UPDATE by id, without loading the property
+        property_status = {'active': 'under_contract', 'fulfilled': 'sold'}.get(self.status)
+        if property_status and self.related_property_id:
+            Property.objects.filter(pk=self.related_property_id).update(status=property_status)
+            if Contract.related_property.is_cached(self):
+                self.related_property.status = property_status
 
 
 # -------------------------------------------------------------------------
@@ -1396,7 +1470,10 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['recipient', '-created_at']),
+            models.Index(fields=['recipient', 'is_read', '-created_at']),
+            models.Index(fields=['-created_at']),
             models.Index(fields=['notification_type']),
+            models.Index(fields=['expiry_date']),
             models.Index(fields=['is_read']),
             models.Index(fields=['is_sent']),
         ]
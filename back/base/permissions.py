@@ -1,7 +1,24 @@
 from rest_framework import permissions
 from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import FieldDoesNotExist
 from .utils import check_user_permission
 
+
+def is_related_user(obj, field_name, user):
+    """
+    Check whether obj.<field_name> is the user, comparing the FK column
+    to user.pk so the related user row is never fetched.
+    """
+    if obj is None or user is None or user.pk is None:
+        return False
+    try:
+        field = obj._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return getattr(obj, field_name, None) == user
+    if field.is_relation and field.concrete and (field.many_to_one or field.one_to_one):
+        return getattr(obj, field.attname) == user.pk
+    return getattr(obj, field_name, None) == user
+
 class IsAdmin(permissions.BasePermission):
     """Allow access only to admin users"""
     message = _('You must be an administrator to perform this action.')
@@ -68,7 +85,7 @@ class IsObjectOwner(permissions.BasePermission):
 
         # Direct ownership
         if hasattr(obj, owner_field):
-            return getattr(obj, owner_field) == request.user
+            return is_related_user(obj, owner_field, request.user)
 
         return False
 
@@ -86,7 +103,7 @@ class IsPropertyOwner(permissions.BasePermission):
             return True
 
         # Check if user is property owner
-        return obj.owner == request.user
+        return is_related_user(obj, 'owner', request.user)
 
 class IsAuctionParticipant(permissions.BasePermission):
     """Allow auction participants to access auction data"""
@@ -122,13 +139,13 @@ class IsBidOwner(permissions.BasePermission):
 
         # READ permissions for bidder or property owner
         if request.method in permissions.SAFE_METHODS:
-            if obj.bidder == request.user:
+            if is_related_user(obj, 'bidder', request.user):
                 return True
-            if obj.auction.related_property.owner == request.user:
+            if is_related_user(obj.auction.related_property, 'owner', request.user):
                 return True
 
         # WRITE permissions only for bidder
-        return obj.bidder == request.user
+        return is_related_user(obj, 'bidder', request.user)
 
 class IsDocumentAuthorized(permissions.BasePermission):
     """Control access to documents based on user relationship"""
@@ -140,7 +157,7 @@ class IsDocumentAuthorized(permissions.BasePermission):
             return True
 
         # Document uploader always has access
-        if obj.uploaded_by == request.user:
+        if is_related_user(obj, 'uploaded_by', request.user):
             return True
 
         # Public documents are readable by anyone
@@ -148,12 +165,12 @@ class IsDocumentAuthorized(permissions.BasePermission):
             return True
 
         # Property owner has access to property documents
-        if obj.related_property and obj.related_property.owner == request.user:
+        if obj.related_property_id and is_related_user(obj.related_property, 'owner', request.user):
             return True
 
         # Contract parties have access to contract documents
-        if obj.related_contract and (obj.related_contract.buyer == request.user or
-                                     obj.related_contract.seller == request.user):
+        if obj.related_contract_id and (is_related_user(obj.related_contract, 'buyer', request.user) or
+                                        is_related_user(obj.related_contract, 'seller', request.user)):
             return True
 
         # Users with specific permissions can access certain documents
@@ -192,7 +209,7 @@ class IsContractParty(permissions.BasePermission):
             return True
 
         # Check if user is a contract party
-        return request.user in [obj.buyer, obj.seller]
+        return is_related_user(obj, 'buyer', request.user) or is_related_user(obj, 'seller', request.user)
 
 class ReadOnly(permissions.BasePermission):
     """Allow only read-only access to resources"""
@@ -212,9 +229,8 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 
         # Get owner field from view or use default
         owner_field = getattr(view, 'owner_field', 'owner')
-        owner = getattr(obj, owner_field, None)
 
-        return owner == request.user
+        return is_related_user(obj, owner_field, request.user)
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """Allow admin users full access, others only read access"""
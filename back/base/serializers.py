@@ -57,7 +57,7 @@ class UserBriefSerializer(serializers.ModelSerializer):
                 role_code = obj.primary_role or ''
                 return {
                     'code': role_code,
-                    'name': dict(RoleChoices.CHOICES).get(role_code, '')
+                    'name': RoleChoices.LABELS.get(role_code, '')
                 }
 
             # If not, try to get a role from related data
@@ -278,7 +278,7 @@ class ThreadParticipantSerializer(BaseModelSerializer):
 class MessageThreadSerializer(BaseModelSerializer):
     """Serializer for MessageThread model"""
     participants = ThreadParticipantSerializer(many=True, read_only=True, label=_('المشاركون'))
-    messages_count = serializers.SerializerMethodField(label=_('عدد الرسائل'))
+    messages_count = serializers.IntegerField(source='message_count', read_only=True, label=_('عدد الرسائل'))
     latest_message = serializers.SerializerMethodField(label=_('أحدث رسالة'))
     creator_details = UserBriefSerializer(source='creator', read_only=True, label=_('تفاصيل المنشئ'))
 
@@ -304,9 +304,6 @@ class MessageThreadSerializer(BaseModelSerializer):
             'metadata': {'label': _('بيانات إضافية')},
         }
 
-    def get_messages_count(self, obj):
-        return obj.messages.count()
-
     def get_latest_message(self, obj):
         latest = obj.messages.order_by('-sent_at').first()
         if latest:
@@ -673,7 +670,7 @@ class AuctionSerializer(BaseModelSerializer):
     auction_type_display = serializers.CharField(source='get_auction_type_display', read_only=True, label=_('نوع المزاد المعروض'))
     status_display = serializers.CharField(source='get_status_display', read_only=True, label=_('الحالة المعروضة'))
     highest_bid = serializers.SerializerMethodField(label=_('أعلى مزايدة'))
-    bids_count = serializers.SerializerMethodField(label=_('عدد المزايدات'))
+    bids_count = serializers.IntegerField(source='bid_count', read_only=True, label=_('عدد المزايدات'))
     time_remaining = serializers.SerializerMethodField(label=_('الوقت المتبقي'))
 
     class Meta:
@@ -765,15 +762,14 @@ class AuctionSerializer(BaseModelSerializer):
             }
         return None
 
-    def get_bids_count(self, obj):
-        return obj.bids.count()
-
     def get_time_remaining(self, obj):
-        from django.utils import timezone
-        import datetime
+        # Read the clock once per response; every row in a list then shares the same reference time
+        if 'now' not in self.context:
+            self.context['now'] = timezone.now()
+        now = self.context['now']
 
-        if obj.end_date > timezone.now():
-            time_left = obj.end_date - timezone.now()
+        if obj.end_date > now:
+            time_left = obj.end_date - now
             days = time_left.days
             hours, remainder = divmod(time_left.seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from base.admin import EstimatedCountPaginator
+from base.models import MessageThread, Message
+
+User = get_user_model()
+
+
+class EstimatedCountPaginatorTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(12):
+            User.objects.create_user(
+                email=f'page{i}@test.com', password='password',
+                first_name='Page', last_name=str(i)
+            )
+
+    def _paginator(self, estimate):
+        paginator = EstimatedCountPaginator(User.objects.order_by('pk'), 5)
+        patcher = mock.patch.object(EstimatedCountPaginator, '_estimated_count', return_value=estimate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return paginator
+
+    def test_low_estimate_does_not_hide_last_page(self):
+        paginator = self._paginator(7)
+        self.assertEqual(paginator.count, 7)
+        self.assertEqual(len(paginator.page(3).object_list), 2)
+        self.assertEqual(paginator.count, 12)
+
+    def test_low_estimate_does_not_truncate_last_estimated_page(self):
+        paginator = self._paginator(7)
+        self.assertEqual(len(paginator.page(2).object_list), 5)
+        self.assertEqual(paginator.num_pages, 3)
+
+    def test_high_estimate_rejects_pages_past_real_end(self):
+        paginator = self._paginator(100)
+        paginator.estimate_threshold = 5
+        self.assertEqual(len(paginator.page(1).object_list), 5)
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+        self.assertEqual(paginator.count, 12)
+
+    def test_exact_count_without_estimate(self):
+        paginator = self._paginator(None)
+        self.assertEqual(paginator.count, 12)
+        self.assertEqual(len(paginator.page(3).object_list), 2)
+
+
+class MessageAdminChangelistTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            email='admin@test.com', password='password', first_name='Admin', last_name='User'
+        )
+        cls.thread = MessageThread.objects.create(subject='Thread', thread_type='other', creator=cls.admin)
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def _add_messages(self, count):
+        Message.objects.bulk_create(
+            Message(thread=self.thread, sender=self.admin, content='x' * 60) for _ in range(count)
+        )
+
+    def _changelist_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/admin/base/message/')
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_changelist_query_count_does_not_grow_with_rows(self):
+        self._add_messages(2)
+        queries = self._changelist_queries()
+
+        self._add_messages(18)
+        with self.assertNumQueries(queries):
+            response = self.client.get('/admin/base/message/')
+        self.assertContains(response, 'x' * 50)
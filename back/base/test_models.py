@@ -0,0 +1,274 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from base.apps import backfill_thread_counters
+from base.models import Property, Auction, Bid, MessageThread, ThreadParticipant, Message
+from base.permissions import is_related_user
+from base.utils import update_auction_statuses, recount_thread_counters
+
+User = get_user_model()
+
+
+def create_property(owner, number=1):
+    return Property.objects.create(
+        title=f'Property {number}', property_type='land', address='Street', city='Riyadh',
+        owner=owner, size_sqm=100, deed_number=f'DEED-{number}'
+    )
+
+
+def create_auction(related_property, **kwargs):
+    now = timezone.now()
+    values = {
+        'title': 'Auction', 'related_property': related_property, 'starting_bid': 100,
+        'start_date': now - timedelta(hours=1), 'end_date': now + timedelta(days=1),
+    }
+    values.update(kwargs)
+    return Auction.objects.create(**values)
+
+
+# -------------------------------------------------------------------------
+# Bid Model Tests
+# -------------------------------------------------------------------------
+
+
+class BidSaveTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email='owner@test.com', password='password', first_name='Owner', last_name='User'
+        )
+        cls.bidder = User.objects.create_user(
+            email='bidder@test.com', password='password', first_name='Bidder', last_name='User'
+        )
+        cls.property = create_property(cls.owner)
+
+    def setUp(self):
+        self.auction = create_auction(self.property)
+
+    def _bid(self, amount, status='accepted'):
+        return Bid.objects.create(
+            auction=Auction.objects.get(pk=self.auction.pk), bidder=self.bidder,
+            bid_amount=Decimal(amount), status=status
+        )
+
+    def test_first_accepted_bid_is_inserted_winning(self):
+        bid = self._bid('150')
+        self.assertEqual(Bid.objects.get(pk=bid.pk).status, 'winning')
+
+        self.auction.refresh_from_db()
+        self.assertEqual(self.auction.current_bid, Decimal('150'))
+        self.assertEqual(self.auction.bid_count, 1)
+        self.assertEqual(self.auction.bid_history[0]['id'], bid.pk)
+
+    def test_higher_bid_outbids_previous_winner(self):
+        first = self._bid('150')
+        second = self._bid('200')
+
+        self.assertEqual(Bid.objects.get(pk=first.pk).status, 'outbid')
+        self.assertEqual(Bid.objects.get(pk=second.pk).status, 'winning')
+        self.auction.refresh_from_db()
+        self.assertEqual(self.auction.current_bid, Decimal('200'))
+        self.assertEqual(self.auction.bid_count, 2)
+
+    def test_auction_list_reads_stored_bid_count(self):
+        self._bid('150')
+        self._bid('200')
+        Auction.objects.filter(pk=self.auction.pk).update(is_published=True)
+        client = APIClient()
+        client.force_authenticate(self.bidder)
+
+        response = client.get('/api/auctions/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['bids_count'], 2)
+
+    def test_lower_bid_leaves_winner_and_current_bid(self):
+        first = self._bid('200')
+        second = self._bid('150')
+
+        self.assertEqual(Bid.objects.get(pk=first.pk).status, 'winning')
+        self.assertEqual(Bid.objects.get(pk=second.pk).status, 'accepted')
+        self.auction.refresh_from_db()
+        self.assertEqual(self.auction.current_bid, Decimal('200'))
+        self.assertEqual(self.auction.bid_count, 2)
+
+    def test_failed_auction_update_rolls_back_outbid(self):
+        first = self._bid('150')
+        with mock.patch.object(Auction, 'save', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self._bid('200')
+
+        self.assertEqual(Bid.objects.get(pk=first.pk).status, 'winning')
+        self.assertEqual(Bid.objects.count(), 1)
+
+
+# -------------------------------------------------------------------------
+# Auction Status Tests
+# -------------------------------------------------------------------------
+
+
+class UpdateAuctionStatusesTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email='owner@test.com', password='password', first_name='Owner', last_name='User'
+        )
+        cls.property = create_property(cls.owner)
+
+    def _auction(self, status, start_offset, end_offset):
+        now = timezone.now()
+        return create_auction(
+            self.property, status=status,
+            start_date=now + timedelta(hours=start_offset), end_date=now + timedelta(hours=end_offset)
+        )
+
+    def _status(self, auction):
+        auction.refresh_from_db()
+        return auction.status
+
+    def test_moves_auctions_to_status_matching_dates(self):
+        upcoming = self._auction('live', 1, 2)
+        running = self._auction('scheduled', -1, 1)
+        finished = self._auction('live', -2, -1)
+
+        self.assertEqual(update_auction_statuses(Auction.objects.all()), 3)
+        self.assertEqual(self._status(upcoming), 'scheduled')
+        self.assertEqual(self._status(running), 'live')
+        self.assertEqual(self._status(finished), 'ended')
+
+    def test_drafts_only_move_to_scheduled(self):
+        future_draft = self._auction('draft', 1, 2)
+        started_draft = self._auction('draft', -1, 1)
+        ended_draft = self._auction('draft', -2, -1)
+
+        self.assertEqual(update_auction_statuses(Auction.objects.all()), 1)
+        self.assertEqual(self._status(future_draft), 'scheduled')
+        self.assertEqual(self._status(started_draft), 'draft')
+        self.assertEqual(self._status(ended_draft), 'draft')
+
+    def test_leaves_closed_and_unchanged_auctions(self):
+        self._auction('completed', -2, -1)
+        self._auction('cancelled', 1, 2)
+        self._auction('live', -1, 1)
+
+        self.assertEqual(update_auction_statuses(Auction.objects.all()), 0)
+
+
+# -------------------------------------------------------------------------
+# Message Thread Counter Tests
+# -------------------------------------------------------------------------
+
+
+class MessageThreadCounterTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='member@test.com', password='password', first_name='Member', last_name='User'
+        )
+        cls.other = User.objects.create_user(
+            email='guest@test.com', password='password', first_name='Guest', last_name='User'
+        )
+
+    def setUp(self):
+        self.thread = MessageThread.objects.create(subject='Thread', thread_type='other', creator=self.user)
+
+    def _counts(self):
+        self.thread.refresh_from_db()
+        return self.thread.message_count, self.thread.participant_count
+
+    def _message(self):
+        return Message.objects.create(thread=self.thread, sender=self.user, content='Hello')
+
+    def test_messages_increment_and_decrement(self):
+        first = self._message()
+        self._message()
+        self._message()
+        self.assertEqual(self._counts(), (3, 0))
+
+        first.delete()
+        self.assertEqual(self._counts(), (2, 0))
+
+        # Queryset deletes go through post_delete too
+        Message.objects.filter(thread=self.thread).delete()
+        self.assertEqual(self._counts(), (0, 0))
+
+    def test_participant_count_tracks_active_participants(self):
+        member = ThreadParticipant.objects.create(thread=self.thread, user=self.user)
+        guest = ThreadParticipant.objects.create(thread=self.thread, user=self.other)
+        self.assertEqual(self._counts(), (0, 2))
+
+        guest.is_active = False
+        guest.save()
+        self.assertEqual(self._counts(), (0, 1))
+
+        member.delete()
+        self.assertEqual(self._counts(), (0, 0))
+
+    def test_recount_restores_counters(self):
+        ThreadParticipant.objects.create(thread=self.thread, user=self.user)
+        ThreadParticipant.objects.create(thread=self.thread, user=self.other, is_active=False)
+        self._message()
+        MessageThread.objects.update(message_count=0, participant_count=5)
+
+        self.assertEqual(recount_thread_counters(MessageThread.objects.all()), 1)
+        self.assertEqual(self._counts(), (1, 1))
+
+    def test_backfill_only_touches_stale_threads(self):
+        self._message()
+        ThreadParticipant.objects.create(thread=self.thread, user=self.user)
+        empty = MessageThread.objects.create(subject='Empty', thread_type='other', creator=self.user)
+        MessageThread.objects.update(message_count=0, participant_count=0)
+
+        backfill_thread_counters(apps.get_app_config('base'), apps=apps)
+
+        self.assertEqual(self._counts(), (1, 1))
+        empty.refresh_from_db()
+        self.assertEqual((empty.message_count, empty.participant_count), (0, 0))
+
+    def test_thread_list_reads_stored_message_count(self):
+        ThreadParticipant.objects.create(thread=self.thread, user=self.user)
+        self._message()
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        response = client.get('/api/threads/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'][0]['messages_count'], 1)
+
+
+# -------------------------------------------------------------------------
+# Permission Tests
+# -------------------------------------------------------------------------
+
+
+class IsRelatedUserTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email='owner@test.com', password='password', first_name='Owner', last_name='User'
+        )
+        cls.other = User.objects.create_user(
+            email='other@test.com', password='password', first_name='Other', last_name='User'
+        )
+        cls.property = create_property(cls.owner)
+
+    def test_matches_owner_without_loading_user(self):
+        prop = Property.objects.get(pk=self.property.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(is_related_user(prop, 'owner', self.owner))
+            self.assertFalse(is_related_user(prop, 'owner', self.other))
+
+    def test_anonymous_and_missing_objects_never_match(self):
+        self.assertFalse(is_related_user(self.property, 'owner', AnonymousUser()))
+        self.assertFalse(is_related_user(None, 'owner', self.owner))
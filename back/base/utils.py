@@ -1,7 +1,7 @@
 import os
 import uuid
 import time
-import random
+import secrets
 import string
 import hashlib
 from typing import Union, List, Dict, Optional, Tuple, Any
@@ -16,8 +16,8 @@ from django.core.files.storage import default_storage
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.utils.text import slugify
-from django.db.models import Avg, Max, Min, Q
-from .models import RoleChoices
+from django.db.models import Avg, Max, Min, Q, F, Case, When, Value, CharField
+from .models import RoleChoices, thread_counter_expressions
 
 # -------------------------------------------------------------------------
 # File and Image Handling Utilities
@@ -204,7 +204,10 @@ def generate_random_code(length: int = 6, chars: str = string.digits) -> str:
     Returns:
         Random code
     """
-    return ''.join(random.choice(chars) for _ in range(length))
+    if chars == string.digits:
+        # Single CSPRNG call for the common numeric case
+        return f"{secrets.randbelow(10 ** length):0{length}d}"
+    return ''.join(secrets.choice(chars) for _ in range(length))
 
 
 def generate_secure_token(length: int = 32) -> str:
@@ -217,7 +220,6 @@ def generate_secure_token(length: int = 32) -> str:
     Returns:
         Secure random token string
     """
-    import secrets
     alphabet = string.ascii_letters + string.digits
     return ''.join(secrets.choice(alphabet) for _ in range(length))
 
@@ -239,7 +241,7 @@ def generate_reference_number(prefix: str, year: Optional[int] = None,
     if year is None:
         year = datetime.now().year
 
-    random_part = ''.join(random.choice(string.digits) for _ in range(length))
+    random_part = generate_random_code(length)
     return f"{prefix}{separator}{year}{separator}{random_part}"
 
 
@@ -616,6 +618,50 @@ def check_auction_status(auction) -> str:
     return auction.status
 
 
+def update_auction_statuses(queryset) -> int:
+    """
+    Bring the status of every auction in a queryset in line with its dates
+    using a single UPDATE; the set-based counterpart of check_auction_status.
+
+    Drafts are only ever moved to 'scheduled' (when their start date is
+    still ahead); a draft whose start has passed is left for a person to publish.
+
+    Args:
+        queryset: Auction queryset
+
+    Returns:
+        Number of auctions whose status changed
+    """
+    now = timezone.now()
+    new_status = Case(
+        When(start_date__gt=now, then=Value('scheduled')),
+        When(end_date__lt=now, then=Value('ended')),
+        default=Value('live'),
+        output_field=CharField(),
+    )
+    return (
+        queryset.exclude(status__in=['completed', 'cancelled'])
+        .exclude(status='draft', start_date__lte=now)
+        .annotate(new_status=new_status)
+        .exclude(status=F('new_status'))
+        .update(status=new_status)
+    )
+
+
+def recount_thread_counters(queryset) -> int:
+    """
+    Recompute message_count and participant_count for every thread in a
+    queryset from the related rows, in a single UPDATE.
+
+    Args:
+        queryset: MessageThread queryset
+
+    Returns:
+        Number of threads updated
+    """
+    return queryset.update(**thread_counter_expressions(queryset.model))
+
+
 def extend_auction_time(auction, extension_minutes: int = 10) -> bool:
     """
     Extend auction end time when bids are placed near the end.
@@ -801,12 +847,23 @@ def get_user_permissions(user):
     Args:
         user: User object
 
+    The result is memoized on the user instance, so repeated checks within a
+    request share one set and one owned-properties query.
+
     Returns:
-        Set of permission strings
+        Frozenset of permission strings
     """
     if not user or not hasattr(user, 'is_authenticated') or not user.is_authenticated:
-        return set()
+        return frozenset()
+
+    cached = getattr(user, '_base_permissions_cache', None)
+    if cached is None:
+        cached = frozenset(_compute_user_permissions(user))
+        user._base_permissions_cache = cached
+    return cached
 
+def _compute_user_permissions(user):
+    """Build the permission set for an authenticated user."""
     permissions = set()
 
     # Admin users have all permissions
@@ -1,7 +1,7 @@
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.db.models import Q
+from django.db.models import Q, Exists, OuterRef
 from rest_framework import generics, status, filters, permissions, serializers
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import InMemoryUploadedFile
@@ -320,15 +320,18 @@ class AuctionListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         user = self.request.user
 
+        # bids_count is read from the denormalized Auction.bid_count column
+        queryset = Auction.objects.all()
+
         # Admin sees all auctions
         if user.is_staff:
-            return Auction.objects.all()
+            return queryset
 
         # Others see own properties' auctions or public auctions
         own_auctions = Q(related_property__owner=user)
         public_auctions = Q(is_published=True, is_private=False)
 
-        return Auction.objects.filter(own_auctions | public_auctions)
+        return queryset.filter(own_auctions | public_auctions)
 
     @log_api_calls
     @api_verified_user_required
@@ -359,11 +362,10 @@ class AuctionDetailView(generics.RetrieveAPIView):
         # Define access queries
         own_auctions = Q(related_property__owner=user)
         public_auctions = Q(is_published=True, is_private=False)
-        bid_auctions = Q(bids__bidder=user)
+        # EXISTS instead of joining bids, so no DISTINCT is needed
+        bid_auctions = Exists(Bid.objects.filter(auction=OuterRef('pk'), bidder=user))
 
-        return Auction.objects.filter(
-            own_auctions | public_auctions | bid_auctions
-        ).distinct()
+        return Auction.objects.filter(own_auctions | public_auctions | bid_auctions)
 
     @timing_decorator
     def retrieve(self, request, *args, **kwargs):
@@ -566,10 +568,11 @@ class DocumentListCreateView(generics.ListCreateAPIView):
         contract_buyer_documents = Q(related_contract__buyer=user)
         public_documents = Q(is_public=True)
 
+        # Every lookup follows a forward FK, so rows cannot repeat and DISTINCT is unnecessary
         return Document.objects.filter(
             own_documents | property_documents | auction_documents |
             contract_seller_documents | contract_buyer_documents | public_documents
-        ).distinct()
+        )
 
     @api_verified_user_required
     def perform_create(self, serializer):
@@ -622,7 +625,8 @@ class DocumentEditView(generics.UpdateAPIView):
     @log_api_calls
     @api_verified_user_required
     def perform_update(self, serializer):
-        instance = self.get_object()
+        # update() already loaded and permission-checked the document
+        instance = serializer.instance
         verification_status = serializer.validated_data.get('verification_status')
         if verification_status == 'verified' and instance.verification_status != 'verified':
             if self.request.user.is_staff or check_user_permission(self.request.user, 'verify_documents'):
@@ -793,12 +797,15 @@ class MessageThreadListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         user = self.request.user
+        # messages_count is read from the denormalized MessageThread.message_count column
+        queryset = MessageThread.objects.all()
+
         # Admin sees all threads
         if user.is_staff:
-            return MessageThread.objects.all()
+            return queryset
 
         # Regular users see threads where they're a participant
-        return MessageThread.objects.filter(participants__user=user, participants__is_active=True)
+        return queryset.filter(participants__user=user, participants__is_active=True)
 
     @api_verified_user_required
     def perform_create(self, serializer):
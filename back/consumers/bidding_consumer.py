@@ -160,34 +160,24 @@ class BiddingConsumer(BaseConsumer):
             if amount < min_bid:
                 return None, f"Bid must be at least {min_bid}"
 
-            if user.id == auction.related_property.owner.id:
+            if user.id == auction.related_property.owner_id:
                 return None, "You cannot bid on your own auction"
 
             with transaction.atomic():
-                # Create the bid
+                # Outbid the previous leader in one UPDATE
+                Bid.objects.filter(auction=auction, status='winning').update(status='outbid')
+
+                # Create the bid as the winner; Bid.save() records current_bid,
+                # bid_count and history on the auction in the same transaction
                 bid = Bid.objects.create(
                     auction=auction,
                     bidder=user,
                     bid_amount=amount,
                     is_auto_bid=bool(auto_bid_limit),
-                    status='pending',
+                    status='winning',
                     bid_time=timezone.now()
                 )
 
-                # Update auction
-                auction.current_bid = amount
-                auction.save(update_fields=['current_bid'])
-
-                # Update previous winning bid
-                prev_winning = Bid.objects.filter(auction=auction, status='winning').first()
-                if prev_winning:
-                    prev_winning.status = 'outbid'
-                    prev_winning.save(update_fields=['status'])
-
-                # Set this as winning
-                bid.status = 'winning'
-                bid.save(update_fields=['status'])
-
                 return {
                     'id': str(bid.id),
                     'bidder': {